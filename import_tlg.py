@@ -11,25 +11,230 @@ bl_info = {
 
 import bpy
 import struct
+import sys
 import os
+import re
+import bisect
 import glob
+import mmap
 import traceback
 import subprocess
+import collections
+import concurrent.futures
 import math
 import numpy as np
-import cProfile
-import pstats
-import io
-from mathutils import Matrix, Quaternion, Vector
+from mathutils import Matrix, Vector
 from bpy.props import (
     StringProperty,
     FloatProperty,
+    BoolProperty,
     CollectionProperty,
 )
 from bpy_extras.io_utils import (
     ImportHelper,
 )
 
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    prange = range
+    _HAVE_NUMBA = False
+
+# Precompiled binary layouts used by the .bod and .data readers
+_VEC4 = struct.Struct('<4f')
+_MAT16 = struct.Struct('<16f')
+_CDAT_HEADER = struct.Struct('<4shhii')
+# Animation .data header of a single-animation file, and the leading fields of its 32-byte track entries
+_ANIM_SINGLE_HEADER = struct.Struct('<4s12xIfII')
+# Header pointers and per-animation info (frame rate, unused float, track count, frame count) of a multi-animation file
+_ANIM_POINTER = struct.Struct('<I')
+_ANIM_INFO = struct.Struct('<IfII')
+_ANIM_TRACK_ENTRY = np.dtype([('flag', '<u4'), ('ptr_trans', '<u4'), ('ptr_rot', '<u4'), ('ptr_scale', '<u4'),
+                              ('ptr_bone_name', '<u4')])
+# Track flags whose translation / rotation / scale channels hold a key per frame (others hold one), as bitmasks
+_FULL_TRANS_FLAGS = (1 << 0) | (1 << 3) | (1 << 4) | (1 << 5)
+_FULL_ROT_FLAGS = (1 << 0) | (1 << 4) | (1 << 6)
+_FULL_SCALE_FLAGS = (1 << 0) | (1 << 3)
+# Largest spread of values over an animation for which a channel is keyed once rather than on every frame
+_CONSTANT_CHANNEL_EPSILON = 1e-6
+# One 0x20-byte vertex of a GEOMETRY .data buffer
+_GEOMETRY_VERTEX = np.dtype([('pos', '<3f4'), ('pad', 'V12'), ('uv', '<2f4')])
+
+# Structs for the value counts read_long/read_float are called with, keyed by count
+_INT32_ARRAYS = {n: struct.Struct(f'<{n}i') for n in (1, 2, 3, 4, 7, 16)}
+_FLOAT32_ARRAYS = {n: struct.Struct(f'<{n}f') for n in (1, 3, 4, 16)}
+
+_STRUCT_CACHE = {}
+
+# Variant mesh names: the base name before the first _fresnel (group 1), else before the first _fur (group 2).
+# Fresnel is tried across the whole name before fur, so it takes precedence wherever it appears.
+_VARIANT_SUFFIX_RE = re.compile(r'^(?:(.*?)_fresnel|(.*?)_fur)', re.DOTALL)
+
+# Custom property marking images whose blue channel was rebuilt as a normal map
+_REBUILT_NORMAL_PROP = "tlg_rebuilt_normal"
+
+# Placeholder texture slots, bare or as the last component of a texture path
+_NULL_TEXTURE_RE = re.compile(r'(?:^|/)_black_texture$', re.IGNORECASE)
+
+# Parsed .bod objects keyed by (absolute path, mtime), reused across imports in a session
+_PARSED_BOD_CACHE = {}
+# Most files kept in _PARSED_BOD_CACHE; the oldest entries are dropped past this
+_PARSED_BOD_CACHE_MAX = 512
+
+
+def _get_struct(fmt):
+    """Returns a compiled Struct for fmt, compiling it only on first use."""
+    compiled = _STRUCT_CACHE.get(fmt)
+    if compiled is None:
+        compiled = _STRUCT_CACHE[fmt] = struct.Struct(fmt)
+    return compiled
+
+
+def _variant_type(name):
+    """Returns 'fresnel' or 'fur' for a variant mesh name, or None for a base mesh."""
+    variant_match = _VARIANT_SUFFIX_RE.match(name)
+    if not variant_match: return None
+    return "fresnel" if variant_match.lastindex == 1 else "fur"
+
+
+def _read_bod_bytes(filepath):
+    """Reads a .bod file for parsing, or returns None when its parse is cached or it can't be read."""
+    abs_path = os.path.abspath(filepath)
+    try:
+        if (abs_path, os.stat(abs_path).st_mtime_ns) in _PARSED_BOD_CACHE:
+            return None
+        with open(abs_path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _weight_group_breaks(bone_ids, vert_weights):
+    """Returns the indices where a new (bone, weight) run starts in sorted influence arrays."""
+    breaks = np.empty(len(bone_ids), np.int64)
+    count = 0
+    for i in range(1, len(bone_ids)):
+        if bone_ids[i] != bone_ids[i - 1] or vert_weights[i] != vert_weights[i - 1]:
+            breaks[count] = i
+            count += 1
+    return breaks[:count]
+
+
+if _HAVE_NUMBA:
+    _weight_group_breaks = njit(cache=True)(_weight_group_breaks)
+
+
+def _quats_to_mat3(quats):
+    """Converts (N, 4) wxyz quaternions to (N, 3, 3) rotation matrices, as Quaternion.to_matrix does."""
+    w, x, y, z = quats.T
+    mats = np.empty((len(quats), 3, 3))
+    mats[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    mats[:, 0, 1] = 2.0 * (x * y - w * z)
+    mats[:, 0, 2] = 2.0 * (x * z + w * y)
+    mats[:, 1, 0] = 2.0 * (x * y + w * z)
+    mats[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    mats[:, 1, 2] = 2.0 * (y * z - w * x)
+    mats[:, 2, 0] = 2.0 * (x * z - w * y)
+    mats[:, 2, 1] = 2.0 * (y * z + w * x)
+    mats[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return mats
+
+
+def _mat3_to_quats(mats):
+    """
+    Returns the rotation of (N, 3, 3) matrices as (N, 4) wxyz quaternions, matching Matrix.decompose():
+    columns are normalized, negative-determinant matrices are flipped and w is kept non-negative.
+    """
+    mats = mats / np.linalg.norm(mats, axis=1, keepdims=True)
+    mats[np.linalg.det(mats) < 0] *= -1.0
+
+    m00, m01, m02 = mats[:, 0, 0], mats[:, 0, 1], mats[:, 0, 2]
+    m10, m11, m12 = mats[:, 1, 0], mats[:, 1, 1], mats[:, 1, 2]
+    m20, m21, m22 = mats[:, 2, 0], mats[:, 2, 1], mats[:, 2, 2]
+    quats = np.empty((len(mats), 4))
+
+    # Pick the numerically largest component per matrix, then flip its sign where needed to keep w >= 0
+    x_major = (m22 < 0) & (m00 > m11)
+    y_major = (m22 < 0) & ~x_major
+    z_major = (m22 >= 0) & (m00 < -m11)
+    w_major = ~(x_major | y_major | z_major)
+
+    for mask, trace, sign_neg, major, others in (
+            (x_major, 1 + m00 - m11 - m22, m21 < m12, 1, ((0, m21 - m12), (2, m10 + m01), (3, m02 + m20))),
+            (y_major, 1 - m00 + m11 - m22, m02 < m20, 2, ((0, m02 - m20), (1, m10 + m01), (3, m21 + m12))),
+            (z_major, 1 - m00 - m11 + m22, m10 < m01, 3, ((0, m10 - m01), (1, m02 + m20), (2, m21 + m12))),
+            (w_major, 1 + m00 + m11 + m22, np.zeros(len(mats), bool), 0,
+             ((1, m21 - m12), (2, m02 - m20), (3, m10 - m01)))):
+        if not mask.any(): continue
+        s = 2.0 * np.sqrt(trace[mask])
+        s[sign_neg[mask]] *= -1.0
+        quats[mask, major] = 0.25 * s
+        for idx, value in others:
+            quats[mask, idx] = value[mask] / s
+
+    return quats / np.linalg.norm(quats, axis=1, keepdims=True)
+
+
+def _pose_delta_rotations(rest_rots, rest_index, quats):
+    """
+    Per-key loop equivalent of _mat3_to_quats(rest_rots[rest_index] @ _quats_to_mat3(quats)), for JIT compilation:
+    it fuses the three passes, keeps each key's matrices in scalar locals and runs the keys in parallel.
+    """
+    out = np.empty((len(quats), 4))
+    for k in prange(len(quats)):
+        a = rest_rots[rest_index[k]]
+        w, x, y, z = quats[k, 0], quats[k, 1], quats[k, 2], quats[k, 3]
+        r00, r01, r02 = 1.0 - 2.0 * (y * y + z * z), 2.0 * (x * y - w * z), 2.0 * (x * z + w * y)
+        r10, r11, r12 = 2.0 * (x * y + w * z), 1.0 - 2.0 * (x * x + z * z), 2.0 * (y * z - w * x)
+        r20, r21, r22 = 2.0 * (x * z - w * y), 2.0 * (y * z + w * x), 1.0 - 2.0 * (x * x + y * y)
+
+        m00 = a[0, 0] * r00 + a[0, 1] * r10 + a[0, 2] * r20
+        m01 = a[0, 0] * r01 + a[0, 1] * r11 + a[0, 2] * r21
+        m02 = a[0, 0] * r02 + a[0, 1] * r12 + a[0, 2] * r22
+        m10 = a[1, 0] * r00 + a[1, 1] * r10 + a[1, 2] * r20
+        m11 = a[1, 0] * r01 + a[1, 1] * r11 + a[1, 2] * r21
+        m12 = a[1, 0] * r02 + a[1, 1] * r12 + a[1, 2] * r22
+        m20 = a[2, 0] * r00 + a[2, 1] * r10 + a[2, 2] * r20
+        m21 = a[2, 0] * r01 + a[2, 1] * r11 + a[2, 2] * r21
+        m22 = a[2, 0] * r02 + a[2, 1] * r12 + a[2, 2] * r22
+
+        # Normalize the columns
+        length = math.sqrt(m00 * m00 + m10 * m10 + m20 * m20)
+        m00, m10, m20 = m00 / length, m10 / length, m20 / length
+        length = math.sqrt(m01 * m01 + m11 * m11 + m21 * m21)
+        m01, m11, m21 = m01 / length, m11 / length, m21 / length
+        length = math.sqrt(m02 * m02 + m12 * m12 + m22 * m22)
+        m02, m12, m22 = m02 / length, m12 / length, m22 / length
+        det = m00 * (m11 * m22 - m12 * m21) - m01 * (m10 * m22 - m12 * m20) + m02 * (m10 * m21 - m11 * m20)
+        if det < 0:
+            m00, m01, m02, m10, m11, m12, m20, m21, m22 = -m00, -m01, -m02, -m10, -m11, -m12, -m20, -m21, -m22
+
+        if m22 < 0:
+            if m00 > m11:
+                s = 2.0 * math.sqrt(1 + m00 - m11 - m22)
+                if m21 < m12: s = -s
+                qw, qx, qy, qz = (m21 - m12) / s, 0.25 * s, (m10 + m01) / s, (m02 + m20) / s
+            else:
+                s = 2.0 * math.sqrt(1 - m00 + m11 - m22)
+                if m02 < m20: s = -s
+                qw, qx, qy, qz = (m02 - m20) / s, (m10 + m01) / s, 0.25 * s, (m21 + m12) / s
+        elif m00 < -m11:
+            s = 2.0 * math.sqrt(1 - m00 - m11 + m22)
+            if m10 < m01: s = -s
+            qw, qx, qy, qz = (m10 - m01) / s, (m02 + m20) / s, (m21 + m12) / s, 0.25 * s
+        else:
+            s = 2.0 * math.sqrt(1 + m00 + m11 + m22)
+            qw, qx, qy, qz = 0.25 * s, (m21 - m12) / s, (m02 - m20) / s, (m10 - m01) / s
+
+        length = math.sqrt(qw * qw + qx * qx + qy * qy + qz * qz)
+        out[k, 0], out[k, 1], out[k, 2], out[k, 3] = qw / length, qx / length, qy / length, qz / length
+    return out
+
+
+if _HAVE_NUMBA:
+    _pose_delta_rotations = njit(cache=True, fastmath=True, parallel=True)(_pose_delta_rotations)
+
 
 # --- Addon Preferences for Converter Path ---
 class TLGAddonPreferences(bpy.types.AddonPreferences):
@@ -49,15 +254,21 @@ class TLGAddonPreferences(bpy.types.AddonPreferences):
 
 
 class DataStringRef:
+    __slots__ = ('type', 'name')
+
     def __init__(self): self.type, self.name = "", ""
 
 
 class GeometryBuffer:
+    __slots__ = ('type', 'name', 'verts', 'elems')
+
     def __init__(
             self): self.type, self.name, self.verts, self.elems = "GeometryBuffer", "", DataStringRef(), DataStringRef()
 
 
 class Bone:
+    __slots__ = ('type', 'name', 'assetName', 'parent', 'rootPosition', 'rootRotation')
+
     def __init__(
             self): self.type, self.name, self.assetName, self.parent, self.rootPosition, self.rootRotation = "Bone", "", "", DataStringRef(), [
                                                                                                                                                   0.0] * 3, [
@@ -65,31 +276,45 @@ class Bone:
 
 
 class Mesh:
+    __slots__ = ('type', 'name', 'extensions')
+
     def __init__(self): self.type, self.name, self.extensions = "Mesh", "", []
 
 
 class RenderExt:
+    __slots__ = ('type', 'name', 'baseVertexIndex', 'numVerts', 'baseElemIndex', 'numElems', 'batches')
+
     def __init__(
             self): self.type, self.name, self.baseVertexIndex, self.numVerts, self.baseElemIndex, self.numElems, self.batches = "RenderExt", "", 0, 0, 0, 0, []
 
 
 class SkinCluster:
+    __slots__ = ('type', 'name', 'boneNames', 'bindPoseMatrices')
+
     def __init__(self): self.type, self.name, self.boneNames, self.bindPoseMatrices = "SkinCluster", "", [], []
 
 
 class Skeleton:
+    __slots__ = ('type', 'name', 'bones')
+
     def __init__(self): self.type, self.name, self.bones = "Skeleton", "", []
 
 
 class SceneRoot:
+    __slots__ = ('type', 'name', 'children', 'geometryBuffer')
+
     def __init__(self): self.type, self.name, self.children, self.geometryBuffer = "SceneRoot", "", [], DataStringRef()
 
 
 class MaterialDefinition:
+    __slots__ = ('type', 'name', 'albedo', 'normal', 'emissive', 'specular')
+
     def __init__(
             self): self.type, self.name, self.albedo, self.normal, self.emissive, self.specular = "MaterialDefinition", "", DataStringRef(), DataStringRef(), DataStringRef(), DataStringRef()
 
 class RenderBatch:
+    __slots__ = ('type', 'name', 'materialDefinition', 'start', 'numTris')
+
     def __init__(self):
         self.type = "RenderBatch"
         self.name = ""
@@ -99,9 +324,24 @@ class RenderBatch:
 
 
 class Texture:
+    __slots__ = ('type', 'name')
+
     def __init__(self): self.type, self.name = "Texture", ""
 
 
+class UnknownObject:
+    __slots__ = ('type', 'name')
+
+    def __init__(self): self.type, self.name = type(self).__name__, ""
+
+
+# Parsed object classes by type name; get_obj_struct adds a class for each unknown type it meets
+_OBJECT_CLASSES = {"SceneRoot": SceneRoot, "Skeleton": Skeleton, "Bone": Bone, "Mesh": Mesh, "RenderExt": RenderExt,
+                   "SkinCluster": SkinCluster, "GeometryBuffer": GeometryBuffer,
+                   "MaterialDefinition": MaterialDefinition,
+                   "RenderBatch": RenderBatch, "Texture": Texture}
+
+
 # --- Main Importer Logic ---
 
 class TLGReader:
@@ -110,33 +350,42 @@ class TLGReader:
         self.directory = os.path.dirname(filepath)
         self.scale = scale
         self.context = context
-        self.file, self.data_strings, self.obj_arr = None, [], []
+        self.buf, self.pos = None, 0
+        self.data_strings, self.obj_arr = [], []
         self.object_map = {}
+        self.by_type = {}
         self.texture_base_path = None
+        self.texture_dir_valid = False
+        self.texture_files = []
+        self.texture_index = {}
+        self.backlight_textures = []
+        self.backlight_matches = {}
         self.material_definitions = {}
+        self.skin_cluster_index = []
         self.loaded_files = set()
         self.base_game_dir = self.find_game_base_dir()
         self.correction_matrix = Matrix.Rotation(math.radians(90.0), 4, 'X')
         self.armature_object = None
         self.variant_material_map = {}
-
-
+        self.pending_bind_poses = {}
+        self.dds_cache, self.image_cache = {}, {}
 
     def find_armature_in_scene(self):
-        """Finds the most likely target armature in the scene."""
-        # 1. Prioritize the armature created during this import session.
+        """Finds the most likely target armature in the scene, remembering it for the rest of the import."""
+        # 1. Prioritize the armature created (or already resolved) during this import session.
         if self.armature_object:
             return self.armature_object
 
         # 2. Check for a selected armature
         if self.context.active_object and self.context.active_object.type == 'ARMATURE':
-
-            return self.context.active_object
+            self.armature_object = self.context.active_object
+            return self.armature_object
 
         # 3. Fallback to the first armature found in the scene.
         for obj in self.context.scene.objects:
             if obj.type == 'ARMATURE':
                 print("  - Found first available armature in scene (fallback).")
+                self.armature_object = obj
                 return obj
 
         return None
@@ -166,11 +415,8 @@ class TLGReader:
 
     def get_base_name(self, name):
         """Consistently strips variant suffixes to get a clean base name."""
-        suffixes_to_strip = ["_fresnelShape", "_furShape", "_fresnel", "_fur"]
-        for suffix in suffixes_to_strip:
-            if suffix in name:
-                return name.split(suffix)[0]
-        return name
+        variant_match = _VARIANT_SUFFIX_RE.match(name)
+        return variant_match.group(variant_match.lastindex) if variant_match else name
 
     def build_variant_map(self):
         """
@@ -178,18 +424,14 @@ class TLGReader:
         definitions to the corresponding base mesh name for easy lookup.
         """
         print("\n--- Building Variant Material Map ---")
-        for obj in self.obj_arr:
-            if isinstance(obj, Mesh) and obj.extensions:
-                variant_type = None
-                if "_fresnel" in obj.name:
-                    variant_type = "fresnel"
-                elif "_fur" in obj.name:
-                    variant_type = "fur"
-
-                if not variant_type:
+        for obj in self.by_type.get('Mesh', ()):
+            if obj.extensions:
+                variant_match = _VARIANT_SUFFIX_RE.match(obj.name)
+                if not variant_match:
                     continue
-
-                base_name = self.get_base_name(obj.name)
+                # Same as _variant_type and get_base_name, reusing the match instead of scanning the name again
+                variant_type = "fresnel" if variant_match.lastindex == 1 else "fur"
+                base_name = variant_match.group(variant_match.lastindex)
 
                 try:
                     ext_obj = self.object_map.get(obj.extensions[0].name)
@@ -204,86 +446,242 @@ class TLGReader:
                 except (IndexError, KeyError, AttributeError):
                     print(f"  - WARNING: Could not trace material for variant '{obj.name}'")
 
-    def parse_file(self, filepath):
+    def parse_file(self, filepath, data=None):
+        """Parses a .bod file, from data when its bytes were already read or else by mapping it."""
         abs_path = os.path.abspath(filepath)
         if abs_path in self.loaded_files:
             print(f"  - Skipping already loaded file: {os.path.basename(filepath)}")
             return
 
-        print(f"Parsing file: {os.path.basename(filepath)}")
         self.loaded_files.add(abs_path)
 
         try:
-            with open(filepath, 'rb') as f:
-                self.file = f
-                header = self.read_long(7)
-                if not header:
-                    print("  - Failed to read header")
-                    return
-
-                _, _, data_offset, string_buffer_offset, _, _, data_count = header
-                self.file.seek(string_buffer_offset)
-                string_count = self.read_long()
-                if string_count is None:
-                    print("  - Failed to read string count")
-                    return
-
-                # Read data strings
-                self.data_strings = []
-                for i in range(string_count):
-                    str_len = self.read_long()
-                    if str_len is None:
-                        print(f"  - Failed to read string length at index {i}")
-                        continue
-                    self.data_strings.append(self.read_fixed_string(str_len))
-
-                # Parse objects
-                self.file.seek(data_offset)
-                for i in range(data_count):
-                    self.parse_object_block()
+            cache_key = (abs_path, os.stat(abs_path).st_mtime_ns)
+        except OSError:
+            cache_key = None
+
+        cached_objs = _PARSED_BOD_CACHE.get(cache_key)
+        if cached_objs is not None:
+            print(f"Reusing parsed file: {os.path.basename(filepath)}")
+            for obj in cached_objs:
+                self.register_object(obj)
+            return
+
+        print(f"Parsing file: {os.path.basename(filepath)}")
+        first_obj = len(self.obj_arr)
+
+        try:
+            if data is None:
+                with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    parsed = self.parse_buffer(mm)
+            else:
+                parsed = self.parse_buffer(data)
+
+            if parsed and cache_key:
+                # Only the current version of a file is kept
+                for key in [k for k in _PARSED_BOD_CACHE if k[0] == abs_path]:
+                    del _PARSED_BOD_CACHE[key]
+                while len(_PARSED_BOD_CACHE) >= _PARSED_BOD_CACHE_MAX:
+                    del _PARSED_BOD_CACHE[next(iter(_PARSED_BOD_CACHE))]
+                _PARSED_BOD_CACHE[cache_key] = self.obj_arr[first_obj:]
         except Exception as e:
             print(f"  - ERROR parsing file {filepath}: {e}")
+        finally:
+            self.buf = None
+
+    def parse_buffer(self, buf):
+        """Parses the string table and objects of a .bod image, returning False if any part of it failed to parse."""
+        self.buf, self.pos = buf, 0
+        header = self.read_long(7)
+        if not header:
+            print("  - Failed to read header")
+            return False
+
+        _, _, data_offset, string_buffer_offset, _, _, data_count = header
+        self.pos = string_buffer_offset
+        string_count = self.read_long()
+        if string_count is None:
+            print("  - Failed to read string count")
+            return False
+
+        # Read data strings
+        # Walk the length-prefixed table straight off the buffer with a local cursor
+        self.data_strings = []
+        complete = True
+        buf, pos, buf_len = self.buf, self.pos, len(self.buf)
+        unpack_len = _INT32_ARRAYS[1].unpack_from
+        for i in range(string_count):
+            if pos + 4 > buf_len:
+                print(f"  - Failed to read string length at index {i}")
+                complete = False
+                break
+            str_len = unpack_len(buf, pos)[0]
+            pos += 4
+            if str_len <= 0:
+                self.data_strings.append("")
+                continue
+            data = buf[pos:pos + str_len]
+            pos += len(data)
+            self.data_strings.append(sys.intern(data.split(b'\x00', 1)[0].decode('utf-8', 'ignore')))
+
+        # Parse objects
+        self.pos = data_offset
+        for i in range(data_count):
+            if not self.parse_object_block():
+                complete = False
+        return complete
 
     def load_dependencies(self):
         print("\n--- Loading dependencies ---")
         # 1. Load files in the same directory
-        same_dir_files = glob.glob(os.path.join(self.directory, "*.bod"))
-        for file_path in same_dir_files:
-            if os.path.abspath(file_path) not in self.loaded_files:
-                self.parse_file(file_path)
+        self.parse_files(glob.glob(os.path.join(self.directory, "*.bod")))
 
         # 2. Load material files from the MATERIALS directory
         if self.base_game_dir:
             materials_dir = os.path.join(self.base_game_dir, "MATERIALS")
             if os.path.exists(materials_dir):
                 print(f"  - Searching for materials in: {materials_dir}")
-                material_files = glob.glob(os.path.join(materials_dir, "**", "*.bod"), recursive=True)
-
-                for file_path in material_files:
-                    if os.path.abspath(file_path) not in self.loaded_files:
-                        self.parse_file(file_path)
+                self.parse_files([os.path.join(root, f) for root, _, files in os.walk(materials_dir)
+                                  for f in files if f.lower().endswith(".bod")])
             else:
                 print(f"  - WARNING: Materials directory not found: {materials_dir}")
         else:
             print("  - WARNING: Base game directory not found, skipping MATERIALS search")
 
         # Cache MaterialDefinitions for faster access
-        for obj in self.obj_arr:
-            if isinstance(obj, MaterialDefinition):
-                self.material_definitions[obj.name] = obj
-                print(f"  - Cached MaterialDefinition: {obj.name}")
+        for obj in self.by_type.get('MaterialDefinition', ()):
+            self.material_definitions[obj.name] = obj
+            print(f"  - Cached MaterialDefinition: {obj.name}")
+
+        # Index SkinClusters by reversed name so suffix lookups become a sorted prefix search
+        skin_clusters = [obj for obj in self.by_type.get('SkinCluster', ()) if self.object_map.get(obj.name) is obj]
+        self.skin_cluster_index = sorted((sc.name[::-1], order, sc) for order, sc in enumerate(skin_clusters))
+
+    def parse_files(self, file_paths):
+        """Parses not-yet-loaded .bod files in order while worker threads read up to a few files ahead."""
+        file_paths = [p for p in file_paths if os.path.abspath(p) not in self.loaded_files]
+        if not file_paths:
+            return
+        # Bound the read-ahead so only a window of file contents is held in memory at once
+        window = os.cpu_count() or 1
+        with concurrent.futures.ThreadPoolExecutor(max_workers=window) as pool:
+            pending = collections.deque(pool.submit(_read_bod_bytes, p) for p in file_paths[:window])
+            for i, file_path in enumerate(file_paths):
+                data = pending.popleft().result()
+                if i + window < len(file_paths):
+                    pending.append(pool.submit(_read_bod_bytes, file_paths[i + window]))
+                self.parse_file(file_path, data)
+
+    def find_skin_cluster(self, mesh_name):
+        """Returns the first SkinCluster whose name ends with mesh_name, or None."""
+        key = mesh_name[::-1]
+        index = self.skin_cluster_index
+        i = bisect.bisect_left(index, (key,))
+        best = None
+        while i < len(index) and index[i][0].startswith(key):
+            if best is None or index[i][1] < best[1]:
+                best = index[i]
+            i += 1
+        return best[2] if best else None
+
+    # --- Property readers, dispatched by name from parse_object_block ---
+
+    def _read_ref_property(self, obj, prop_type):
+        ref = DataStringRef()
+        ref_type_index = self.read_long()
+        if ref_type_index is None: return
+        ref.type = self.data_strings[ref_type_index]
+
+        ref_name_index = self.read_long()
+        if ref_name_index is None: return
+        ref.name = self.data_strings[ref_name_index]
+        setattr(obj, prop_type, ref)
+
+    def _read_ref_list_property(self, obj, prop_type):
+        count = self.read_long()
+        values = self.read_long_list(count * 2) if count else ()
+        prop_list = []
+        for item_type_index, item_name_index in zip(values[0::2], values[1::2]):
+            item = DataStringRef()
+            item.type = self.data_strings[item_type_index]
+            item.name = self.data_strings[item_name_index]
+            prop_list.append(item)
+        setattr(obj, prop_type, prop_list)
+
+    def _read_bones_property(self, obj, prop_type):
+        count = self.read_long()
+        values = self.read_long_list(count * 2) if count else ()
+        # Each entry is an unknown value followed by the bone name index
+        setattr(obj, prop_type, [self.data_strings[i] for i in values[1::2]])
+
+    def _read_string_list_property(self, obj, prop_type):
+        count = self.read_long()
+        values = self.read_long_list(count) if count else ()
+        setattr(obj, prop_type, [self.data_strings[i] for i in values])
+
+    def _read_matrices_property(self, obj, prop_type):
+        count = self.read_long()
+        count = min(count, (len(self.buf) - self.pos) // _MAT16.size)
+        buf = self.buf[self.pos:self.pos + count * _MAT16.size]
+        self.pos += len(buf)
+        setattr(obj, prop_type, [list(m) for m in _MAT16.iter_unpack(buf)])
+
+    def _read_int_property(self, obj, prop_type):
+        value = self.read_long()
+        if value is not None:
+            setattr(obj, prop_type, value)
+
+    def _read_string_property(self, obj, prop_type):
+        string_index = self.read_long()
+        if string_index is None: return
+        setattr(obj, prop_type, self.data_strings[string_index])
+
+    def _read_position_property(self, obj, prop_type):
+        position = list(_VEC4.unpack_from(self.buf, self.pos)[:3])  # Drop w component
+        self.pos += _VEC4.size
+        setattr(obj, prop_type, position)
+
+    def _read_rotation_property(self, obj, prop_type):
+        rotation = list(_VEC4.unpack_from(self.buf, self.pos))
+        self.pos += _VEC4.size
+        setattr(obj, prop_type, rotation)
+
+    _PROP_HANDLERS = {
+        "parent": _read_ref_property,
+        "geometryBuffer": _read_ref_property,
+        "verts": _read_ref_property,
+        "elems": _read_ref_property,
+        "albedo": _read_ref_property,
+        "normal": _read_ref_property,
+        "emissive": _read_ref_property,
+        "materialDefinition": _read_ref_property,
+        "specular": _read_ref_property,
+        "children": _read_ref_list_property,
+        "extensions": _read_ref_list_property,
+        "batches": _read_ref_list_property,
+        "bones": _read_bones_property,
+        "boneNames": _read_string_list_property,
+        "bindPoseMatrices": _read_matrices_property,
+        "baseVertexIndex": _read_int_property,
+        "numVerts": _read_int_property,
+        "baseElemIndex": _read_int_property,
+        "numElems": _read_int_property,
+        "start": _read_int_property,
+        "numTris": _read_int_property,
+        "assetName": _read_string_property,
+        "rootPosition": _read_position_property,
+        "rootRotation": _read_rotation_property,
+    }
 
     def parse_object_block(self):
+        """Parses one object and registers it, returning False if the block could not be read."""
         try:
-            obj_type_index = self.read_long()
-            if obj_type_index is None: return
-            obj_type_str = self.data_strings[obj_type_index]
-
-            obj_name_index = self.read_long()
-            if obj_name_index is None: return
-            obj_name_str = self.data_strings[obj_name_index]
-
-            _ = self.read_long()  # Unknown value
+            # Type index, name index and an unknown value, read in one unpack
+            header = self.read_long_list(3)
+            if not header: return False
+            data_strings, handlers = self.data_strings, self._PROP_HANDLERS
+            obj_type_str = data_strings[header[0]]
+            obj_name_str = data_strings[header[1]]
 
             obj = self.get_obj_struct(obj_type_str)
             obj.name = obj_name_str
@@ -293,119 +691,43 @@ class TLGReader:
                 if data_string_index == -1:
                     break
 
-                prop_type = self.data_strings[data_string_index]
+                prop_type = data_strings[data_string_index]
                 prop_length = self.read_long()
-                prop_end = self.file.tell() + prop_length
+                prop_end = self.pos + prop_length
 
                 try:
-                    # Handle different property types
-                    if prop_type in ["parent", "geometryBuffer", "verts", "elems",
-                                     "albedo", "normal", "emissive", "materialDefinition",
-                                     "specular"]:
-                        ref = DataStringRef()
-                        ref_type_index = self.read_long()
-                        if ref_type_index is None: continue
-                        ref.type = self.data_strings[ref_type_index]
-
-                        ref_name_index = self.read_long()
-                        if ref_name_index is None: continue
-                        ref.name = self.data_strings[ref_name_index]
-                        setattr(obj, prop_type, ref)
-
-                    elif prop_type in ["children", "extensions", "batches"]:
-                        count = self.read_long()
-                        prop_list = []
-                        for _ in range(count):
-                            item = DataStringRef()
-
-                            item_type_index = self.read_long()
-                            if item_type_index is None: continue
-                            item.type = self.data_strings[item_type_index]
-
-                            item_name_index = self.read_long()
-                            if item_name_index is None: continue
-                            item.name = self.data_strings[item_name_index]
-
-                            prop_list.append(item)
-                        setattr(obj, prop_type, prop_list)
-
-                    elif prop_type == "bones":
-                        count = self.read_long()
-                        bones = []
-                        for _ in range(count):
-                            self.read_long()  # Unknown value
-                            bone_name_index = self.read_long()
-                            if bone_name_index is None: continue
-                            bones.append(self.data_strings[bone_name_index])
-                        setattr(obj, prop_type, bones)
-
-                    elif prop_type == "boneNames":
-                        count = self.read_long()
-                        names = []
-                        for _ in range(count):
-                            name_index = self.read_long()
-                            if name_index is None: continue
-                            names.append(self.data_strings[name_index])
-                        setattr(obj, prop_type, names)
-
-                    elif prop_type == "bindPoseMatrices":
-                        count = self.read_long()
-                        matrices = []
-                        for _ in range(count):
-                            matrices.append(self.read_float(16))
-                        setattr(obj, prop_type, matrices)
-
-                    elif prop_type in ["baseVertexIndex", "numVerts",
-                                       "baseElemIndex", "numElems"]:
-                        value = self.read_long()
-                        if value is not None:
-                            setattr(obj, prop_type, value)
-
-                    elif prop_type == "assetName":
-                        asset_name_index = self.read_long()
-                        if asset_name_index is None: continue
-                        setattr(obj, prop_type, self.data_strings[asset_name_index])
-
-                    elif prop_type == "rootPosition":
-                        position = self.read_float(3)
-                        self.read_float()  # Skip w component
-                        setattr(obj, "rootPosition", position)
-
-                    elif prop_type == "rootRotation":
-                        rotation = self.read_float(4)
-                        setattr(obj, "rootRotation", rotation)
-
-                    if prop_type == "start":
-                        setattr(obj, prop_type, self.read_long())
-
-                    elif prop_type == "numTris":
-                        setattr(obj, prop_type, self.read_long())
-
+                    handler = handlers.get(prop_type)
+                    # Data classes use __slots__, so skip properties the object has no field for
+                    if handler and hasattr(obj, prop_type):
+                        handler(self, obj, prop_type)
                 except Exception as e:
                     print(f"    - Error parsing property {prop_type}: {e}")
                     traceback.print_exc()
 
-                self.file.seek(prop_end)
+                self.pos = prop_end
 
-            self.obj_arr.append(obj)
-            self.object_map[obj.name] = obj
+            self.register_object(obj)
+            return True
 
         except Exception as e:
             print(f"  - ERROR parsing object block: {e}")
             traceback.print_exc()
+            return False
 
-            self.file.seek(prop_end)
-
+    def register_object(self, obj):
         self.obj_arr.append(obj)
         self.object_map[obj.name] = obj
+        self.by_type.setdefault(type(obj).__name__, []).append(obj)
 
     def build_blender_scene(self):
-        scene_root = next((o for o in self.obj_arr if isinstance(o, SceneRoot)), None)
+        scene_root = self.by_type.get('SceneRoot', [None])[0]
         if not scene_root:
             print("  - ERROR: Could not find SceneRoot object.")
             return
 
         self.texture_base_path = self.find_texture_path()
+        self.index_texture_dir()
+        self.prefetch_textures(scene_root)
         vert_buffer, uv_buffer, face_buffer = None, None, None
 
         if scene_root.geometryBuffer.name:
@@ -413,10 +735,9 @@ class TLGReader:
             if gbuf:
                 vert_path = os.path.join(self.directory, gbuf.verts.name.split('/')[-1] + ".data")
                 elem_path = os.path.join(self.directory, gbuf.elems.name.split('/')[-1] + ".data")
-                geom_data = self.get_data_buffer(vert_path, "GEOMETRY")
-                elem_data = self.get_data_buffer(elem_path, "ELEMS")
-                if geom_data: vert_buffer, uv_buffer = geom_data.get("verts"), geom_data.get("uvs")
-                if elem_data: face_buffer = elem_data.get("faces")
+                geom_data = self.get_geometry_buffer(vert_path)
+                if geom_data: vert_buffer, uv_buffer = geom_data
+                face_buffer = self.get_index_buffer(elem_path)
 
         # Process all children in a single pass
         for child_ref in scene_root.children:
@@ -426,18 +747,33 @@ class TLGReader:
             if isinstance(obj, Skeleton):
                 self.build_skeleton(obj)
             elif isinstance(obj, Mesh) and obj.extensions:
-                if '_fresnel' in obj.name or '_fur' in obj.name:
+                if _variant_type(obj.name):
                     continue  # Skip variants
 
                 render_ext_obj = self.object_map.get(obj.extensions[0].name)
                 if not render_ext_obj: continue
 
-                if vert_buffer and face_buffer:
+                if vert_buffer is not None and face_buffer is not None:
                     self.build_meshes(render_ext_obj, vert_buffer, face_buffer, uv_buffer)
 
-    def setup_mesh_object(self, blender_obj, render_ext_obj):
-        self.apply_skinning_data(blender_obj, render_ext_obj)
-        self.apply_material_data(blender_obj, render_ext_obj)
+        self.apply_bind_poses()
+
+    def apply_bind_poses(self):
+        """Applies the queued skin bind poses with one POSE/OBJECT mode switch per armature."""
+        for armature_obj, bind_map in self.pending_bind_poses.values():
+            bpy.context.view_layer.objects.active = armature_obj
+            bpy.ops.object.mode_set(mode='POSE')
+            arm_inv_world = armature_obj.matrix_world.inverted()
+            for pose_bone in armature_obj.pose.bones:
+                if pose_bone.name not in bind_map: continue
+                world_bind_matrix = bind_map[pose_bone.name][1]
+                if pose_bone.parent and pose_bone.parent.name in bind_map:
+                    pose_bone.matrix = bind_map[pose_bone.parent.name][0] @ world_bind_matrix
+                else:
+                    pose_bone.matrix = arm_inv_world @ world_bind_matrix
+            bpy.ops.object.mode_set(mode='OBJECT')
+            for pose_bone in armature_obj.pose.bones: pose_bone.matrix_basis.identity()
+        self.pending_bind_poses.clear()
 
     def build_meshes(self, render_ext_obj, global_vert_buffer, global_face_buffer, global_uv_buffer):
         start_v, num_verts = render_ext_obj.baseVertexIndex, render_ext_obj.numVerts
@@ -448,19 +784,25 @@ class TLGReader:
         if mesh_face_end > len(global_face_buffer) or num_faces == 0: return []
 
         sub_verts = global_vert_buffer[start_v: start_v + num_verts]
-        sub_faces = global_face_buffer[mesh_face_start:mesh_face_end]
-        mesh_data = bpy.data.meshes.new(render_ext_obj.name)
-        mesh_data.from_pydata(sub_verts, [], sub_faces)
+        loop_vidx = global_face_buffer[mesh_face_start:mesh_face_end].ravel()
 
-        if global_uv_buffer and len(mesh_data.vertices) == len(sub_verts):
+        # Fill the mesh arrays directly instead of going through from_pydata's per-element conversion
+        mesh_data = bpy.data.meshes.new(render_ext_obj.name)
+        mesh_data.vertices.add(num_verts)
+        mesh_data.vertices.foreach_set("co", sub_verts.ravel())
+        mesh_data.loops.add(len(loop_vidx))
+        mesh_data.loops.foreach_set("vertex_index", loop_vidx)
+        mesh_data.polygons.add(num_faces)
+        mesh_data.polygons.foreach_set("loop_start", np.arange(0, len(loop_vidx), 3, dtype=np.int32))
+
+        if global_uv_buffer is not None and len(global_uv_buffer):
             sub_uvs = global_uv_buffer[start_v: start_v + num_verts]
             uv_layer = mesh_data.uv_layers.new(name="UVMap")
-            for p in mesh_data.polygons:
-                for l_idx in p.loop_indices:
-                    l = mesh_data.loops[l_idx]
-                    uv_layer.data[l_idx].uv = (sub_uvs[l.vertex_index][0], 1.0 - sub_uvs[l.vertex_index][1])
 
-        mesh_data.update()
+            # V is already flipped per vertex, so per-loop UVs are a single gather by vertex index
+            uv_layer.data.foreach_set("uv", sub_uvs[loop_vidx].ravel())
+
+        mesh_data.update(calc_edges=True)
         mesh_data.validate()
 
         blender_obj = bpy.data.objects.new(render_ext_obj.name, mesh_data)
@@ -474,6 +816,8 @@ class TLGReader:
         if armature:
             blender_obj.parent = armature
 
+        num_polys = len(mesh_data.polygons)
+        mat_idx = np.zeros(num_polys, dtype=np.int32)
         for batch_ref in render_ext_obj.batches:
             batch = self.object_map.get(batch_ref.name)
             if not (batch and hasattr(batch, 'materialDefinition')): continue
@@ -485,10 +829,12 @@ class TLGReader:
             blender_obj.data.materials.append(material)
             material_index = len(blender_obj.data.materials) - 1
             batch_poly_start = (batch.start // 3) - mesh_face_start
-            batch_poly_end = batch_poly_start + batch.numTris
-            for i in range(batch_poly_start, batch_poly_end):
-                if i < len(mesh_data.polygons):
-                    mesh_data.polygons[i].material_index = material_index
+            batch_poly_end = min(batch_poly_start + batch.numTris, num_polys)
+            mat_idx[max(batch_poly_start, 0):batch_poly_end] = material_index
+
+        # New polygons already use slot 0, so single-material meshes need no write
+        if len(mesh_data.materials) > 1:
+            mesh_data.polygons.foreach_set("material_index", mat_idx)
 
         self.apply_skinning_data(blender_obj, render_ext_obj)
         return [blender_obj]
@@ -551,29 +897,123 @@ class TLGReader:
 
         # Backlight Search
         print("\n--- Checking for Backlight Textures ---")
-        mat_filename = mat_def.name.split('/')[-1]
-        search_key = "_".join(mat_filename.split('_')[1:3])
-        if self.texture_base_path and os.path.exists(self.texture_base_path):
-            candidates = [f for f in os.listdir(self.texture_base_path) if
-                          search_key.lower() in f.lower() and "backlightmap" in f.lower() and f.lower().endswith(
-                              ".gnf")]
-            if candidates:
-                preferred = [c for c in candidates if "_bc7" not in c.lower()]
-                chosen_file = preferred[0] if preferred else candidates[0]
-                print(f"    - SUCCESS: Found Backlight Map -> '{chosen_file}'")
-                self.create_texture_node(material, os.path.splitext(chosen_file)[0], bsdf.inputs['Subsurface Weight'],
-                                         "Subsurface")
-                bsdf.inputs['Subsurface Radius'].default_value = (11.0, 1.0, 1.0)
+        chosen_file = self.find_backlight_texture(mat_def)
+        if chosen_file:
+            print(f"    - SUCCESS: Found Backlight Map -> '{chosen_file}'")
+            self.create_texture_node(material, os.path.splitext(chosen_file)[0], bsdf.inputs['Subsurface Weight'],
+                                     "Subsurface")
+            bsdf.inputs['Subsurface Radius'].default_value = (11.0, 1.0, 1.0)
 
         return material
 
-    def convert_gnf_to_dds(self, gnf_path):
+    def find_backlight_texture(self, mat_def):
+        """Returns the backlight map filename matching a material, preferring non-BC7 variants."""
+        mat_filename = mat_def.name.split('/')[-1]
+        search_key = "_".join(mat_filename.split('_')[1:3]).lower()
+        if search_key in self.backlight_matches:
+            return self.backlight_matches[search_key]
+        candidates = [(f, f_lower) for f, f_lower in self.backlight_textures if search_key in f_lower]
+        preferred = [f for f, f_lower in candidates if "_bc7" not in f_lower]
+        match = preferred[0] if preferred else (candidates[0][0] if candidates else None)
+        self.backlight_matches[search_key] = match
+        return match
+
+    def index_texture_dir(self):
+        """Lists the texture directory once so per-material lookups don't rescan it."""
+        self.texture_files = []
+        self.texture_dir_valid = bool(self.texture_base_path and os.path.isdir(self.texture_base_path))
+        if self.texture_dir_valid:
+            with os.scandir(self.texture_base_path) as entries:
+                self.texture_files = [(e.name, e.name.lower()) for e in entries if e.is_file()]
+        # Lowercased name -> actual name; reversed so the first listed file wins on case-only clashes
+        self.texture_index = {f_lower: f for f, f_lower in reversed(self.texture_files)}
+
+        self.backlight_textures = [(f, f_lower) for f, f_lower in self.texture_files
+                                   if "backlightmap" in f_lower and f_lower.endswith(".gnf")]
+        self.backlight_matches = {}
+
+    def find_gnf_path(self, tex_name):
+        """Resolves a texture reference to its correctly-cased .GNF path in the texture directory."""
+        filename = self.texture_index.get((tex_name.split('/')[-1] + ".GNF").lower())
+        return os.path.join(self.texture_base_path, filename) if filename else None
+
+    def collect_scene_textures(self, scene_root):
+        """Gathers the GNF paths referenced by the materials of the meshes under scene_root."""
+        tex_names = set()
+        for child_ref in scene_root.children:
+            mesh = self.object_map.get(child_ref.name)
+            if not (isinstance(mesh, Mesh) and mesh.extensions): continue
+            is_variant = _variant_type(mesh.name) is not None
+
+            render_ext_obj = self.object_map.get(mesh.extensions[0].name)
+            if not render_ext_obj: continue
+
+            for batch_ref in render_ext_obj.batches:
+                batch = self.object_map.get(batch_ref.name)
+                if not (batch and hasattr(batch, 'materialDefinition')): continue
+                mat_def = self.material_definitions.get(batch.materialDefinition.name)
+                if not mat_def: continue
+
+                # Variants only contribute their albedo (as the fur / fresnel texture)
+                if is_variant:
+                    tex_names.add(mat_def.albedo.name)
+                    continue
+                tex_names.update((mat_def.albedo.name, mat_def.normal.name, mat_def.emissive.name,
+                                  mat_def.specular.name))
+                backlight_file = self.find_backlight_texture(mat_def)
+                if backlight_file:
+                    tex_names.add(os.path.splitext(backlight_file)[0])
+
+        gnf_paths = set()
+        for tex_name in tex_names:
+            if not tex_name or _NULL_TEXTURE_RE.search(tex_name): continue
+            gnf_path = self.find_gnf_path(tex_name)
+            if gnf_path:
+                gnf_paths.add(gnf_path)
+        return gnf_paths
+
+    def prefetch_textures(self, scene_root):
+        """Converts every GNF the scene needs up front, running the converter processes in parallel."""
+        if not self.texture_files:
+            return
+
+        pending = sorted(p for p in self.collect_scene_textures(scene_root)
+                         if not os.path.exists(os.path.splitext(p)[0] + '.dds'))
+        if not pending:
+            return
+
+        converter_exe = self.get_converter_path()
+        if not converter_exe:
+            return
+
+        print(f"--- Converting {len(pending)} texture(s) to DDS ---")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            results = pool.map(lambda p: self.run_gnf_converter(converter_exe, p), pending)
+            # Record the outcomes so material building doesn't re-check or re-run failed conversions
+            for gnf_path, dds_path in zip(pending, results):
+                self.dds_cache[os.path.normcase(gnf_path)] = dds_path
+
+    def get_converter_path(self):
         prefs = bpy.context.preferences.addons[__name__].preferences
         converter_exe = prefs.dds_converter_path
         if not (converter_exe and os.path.exists(converter_exe)):
             print(f"    - ERROR: GNF to DDS Converter path not set or invalid in Add-on Preferences: '{converter_exe}'")
             return None
+        return converter_exe
 
+    def convert_gnf_to_dds(self, gnf_path):
+        key = os.path.normcase(gnf_path)
+        if key in self.dds_cache:
+            return self.dds_cache[key]
+
+        converter_exe = self.get_converter_path()
+        if not converter_exe:
+            return None
+        dds_path = self.dds_cache[key] = self.run_gnf_converter(converter_exe, gnf_path)
+        return dds_path
+
+    def run_gnf_converter(self, converter_exe, gnf_path):
+        """Runs the external converter for one file. Safe to call from worker threads (no bpy access)."""
         dds_path = os.path.splitext(gnf_path)[0] + '.dds'
         if os.path.exists(dds_path):
             return dds_path
@@ -608,27 +1048,11 @@ class TLGReader:
             print(f"      -> GNF to DDS conversion failed: {e}")
             return None
 
-    def convert_normal_map_alternative(self, gnf_path, png_path):
-        """Alternative method to convert normal maps using Blender's built-in image handling"""
-        try:
-            # Try loading directly as image
-            img = bpy.data.images.load(gnf_path, check_existing=True)
-            img.filepath_raw = png_path
-            img.save()
-            print(f"      -> Saved alternative PNG: {png_path}")
-            return png_path
-        except:
-            print("      -> Alternative conversion failed")
-            return None
-
     def apply_skinning_data(self, blender_obj, render_ext_obj):
-        skin_cluster = next((obj for obj in self.object_map.values() if
-                             isinstance(obj, SkinCluster) and obj.name.endswith(render_ext_obj.name)), None)
+        skin_cluster = self.find_skin_cluster(render_ext_obj.name)
 
         if not skin_cluster: return
 
-
-
         armature_obj = self.find_armature_in_scene()
         if not armature_obj:
             print(f"  - Armature not found for skinning mesh {blender_obj.name}, skipping.")
@@ -645,22 +1069,14 @@ class TLGReader:
             mod.object = armature_obj
 
         if skin_cluster.bindPoseMatrices:
-            bone_matrix_map = {name: Matrix(list(zip(*[iter(skin_cluster.bindPoseMatrices[i])] * 4))) for i, name in
-                               enumerate(skin_cluster.boneNames)}
-            bpy.context.view_layer.objects.active = armature_obj
-            bpy.ops.object.mode_set(mode='POSE')
-            arm_inv_world = armature_obj.matrix_world.inverted()
-            for pose_bone in armature_obj.pose.bones:
-                if pose_bone.name not in bone_matrix_map: continue
-                inv_world_bind_matrix = bone_matrix_map[pose_bone.name]
-                world_bind_matrix = inv_world_bind_matrix.inverted()
-                if pose_bone.parent and pose_bone.parent.name in bone_matrix_map:
-                    parent_world_bind_matrix = bone_matrix_map[pose_bone.parent.name].inverted()
-                    pose_bone.matrix = parent_world_bind_matrix.inverted() @ world_bind_matrix
-                else:
-                    pose_bone.matrix = arm_inv_world @ world_bind_matrix
-            bpy.ops.object.mode_set(mode='OBJECT')
-            for pose_bone in armature_obj.pose.bones: pose_bone.matrix_basis.identity()
+            bind_matrices = np.asarray(skin_cluster.bindPoseMatrices, dtype=np.float32).reshape(-1, 4, 4)
+            # Invert all bind matrices in one batched call; a parent's inverse world bind is the stored matrix itself
+            world_binds = np.linalg.inv(bind_matrices.astype(np.float64))
+
+            # Queue the pose so all skins on this armature share a single POSE mode pass
+            _, pending = self.pending_bind_poses.setdefault(armature_obj.name, (armature_obj, {}))
+            for name, mat, world_bind in zip(skin_cluster.boneNames, bind_matrices.tolist(), world_binds.tolist()):
+                pending[name] = (Matrix(mat), Matrix(world_bind))
 
         for name in skin_cluster.boneNames:
             if name not in blender_obj.vertex_groups: blender_obj.vertex_groups.new(name=name)
@@ -671,128 +1087,127 @@ class TLGReader:
                                                            skin_cluster.boneNames)
 
     def parse_and_apply_weights(self, blender_obj, render_ext_obj, weights_filepath, bone_names_map):
-
-
         if render_ext_obj.numVerts == 0:
             print("  - !!! ERROR: numVerts is 0. No weights will be applied. !!!")
             return
 
         with open(weights_filepath, 'rb') as f:
             file_size = os.fstat(f.fileno()).st_size
+            # mmap rejects empty files, and anything shorter than the header holds no records
+            if file_size < 16:
+                print(f"  - WARNING: Weights file is only {file_size} bytes. No weights will be applied.")
+                return
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        with mm:
             # Calculate stride = (total size - header size) / number of vertices
             stride = (file_size - 16) // render_ext_obj.numVerts
 
             #print(f"  - Detected Stride: {stride} bytes per vertex.")
 
-            vert_data_struct = None
-            num_influences = 0
-
             if stride == 32:  # Standard 4-influence format
-                vert_data_struct = struct.Struct('<4I4f')
                 num_influences = 4
 
             elif stride == 64:  # New 8-influence format
-                vert_data_struct = struct.Struct('<8I8f')
                 num_influences = 8
 
             else:
                 print(f"  - !!! ERROR: Unknown or unsupported stride of {stride} bytes. Aborting. !!!")
                 return
 
-            f.seek(16)
-            applied_weights_count = 0
-
-            for i in range(render_ext_obj.numVerts):
-                if f.tell() + vert_data_struct.size > file_size: break
-
-                unpacked_data = vert_data_struct.unpack(f.read(vert_data_struct.size))
-                indices = unpacked_data[:num_influences]
-                weights = unpacked_data[num_influences:]
-
-                for j in range(num_influences):
-                    if weights[j] > 1e-5 and indices[j] < len(bone_names_map):
-                        vgroup = blender_obj.vertex_groups.get(bone_names_map[indices[j]])
-                        if vgroup:
-                            vgroup.add([i], weights[j], 'ADD')
-                            applied_weights_count += 1
-
+            num_verts = min(render_ext_obj.numVerts, (file_size - 16) // stride)
 
+            # Each record is num_influences uint32 bone indices followed by num_influences float32 weights
+            records = np.frombuffer(mm, dtype=np.uint32, count=num_verts * num_influences * 2, offset=16)
+            records = records.reshape(num_verts, num_influences * 2)
+            indices = records[:, :num_influences]
+            weights = records.view(np.float32)[:, num_influences:]
 
-    def apply_material_data(self, blender_obj, render_ext_obj):
-        print(f"\n--- Applying material for '{blender_obj.name}' ---")
-        if not render_ext_obj.batches:
-            print("  - INFO: No batches found on RenderExt. Skipping material assignment.")
-            return
-
-        print(
-            f"  - Found {len(render_ext_obj.batches)} batch(es). Using the first one: '{render_ext_obj.batches[0].name}'")
-        batch_ref = render_ext_obj.batches[0]
-        batch = self.object_map.get(batch_ref.name)
-        if not batch:
-            print(f"  - ERROR: Could not find RenderBatch object '{batch_ref.name}' in the parsed object map.")
-            return
+            mask = (weights > 1e-5) & (indices < len(bone_names_map))
+            vert_ids, slots = np.nonzero(mask)
+            bone_ids = indices[vert_ids, slots]
+            vert_weights = weights[vert_ids, slots]
+            # Drop the views into the map before it is closed
+            del records, indices, weights
 
-        print(f"  - Found RenderBatch. Checking for its MaterialDefinition: '{batch.materialDefinition.name}'")
-        mat_def = self.object_map.get(batch.materialDefinition.name)
-        if not mat_def:
-            print(
-                f"  - ERROR: Could not find MaterialDefinition object '{batch.materialDefinition.name}' in the parsed object map.")
+        if not len(vert_ids):
             return
 
-        print(f"  - Found MaterialDefinition: '{mat_def.name}'")
-        material = bpy.data.materials.get(mat_def.name)
-        if not material:
-            print(f"  - Creating new Blender material: '{mat_def.name}'")
-            material = bpy.data.materials.new(name=mat_def.name)
-            material.use_nodes = True
-            bsdf = material.node_tree.nodes.get('Principled BSDF')
-            if not bsdf:
-                print("  - ERROR: Could not find Principled BSDF node in new material.")
-                return
-
-            self.create_texture_node(material, mat_def.albedo.name, bsdf.inputs['Base Color'], "Albedo")
-            self.create_texture_node(material, mat_def.normal.name, bsdf.inputs['Normal'], "Normal", is_normal_map=True)
-            self.create_texture_node(material, mat_def.emissive.name, bsdf.inputs['Emission Color'], "Emissive")
-
-        if blender_obj.data.materials:
-            blender_obj.data.materials[0] = material
+        # Group influences sharing a bone and weight so each group is a single vertex_groups.add call
+        order = np.lexsort((vert_ids, vert_weights, bone_ids))
+        vert_ids, bone_ids, vert_weights = vert_ids[order], bone_ids[order], vert_weights[order]
+        if _HAVE_NUMBA:
+            breaks = _weight_group_breaks(bone_ids, vert_weights)
         else:
-            blender_obj.data.materials.append(material)
-        print("--- Material setup complete. ---")
+            breaks = np.flatnonzero((np.diff(bone_ids) != 0) | (np.diff(vert_weights) != 0)) + 1
+        group_starts = [0] + breaks.tolist()
+        group_ends = breaks.tolist() + [len(vert_ids)]
+
+        vgroups = [blender_obj.vertex_groups.get(name) for name in bone_names_map]
+        group_bones = bone_ids[group_starts].tolist()
+        group_weights = vert_weights[group_starts].tolist()
+        vert_list = vert_ids.tolist()
+        for start, end, bone_id, weight in zip(group_starts, group_ends, group_bones, group_weights):
+            vgroup = vgroups[bone_id]
+            if vgroup:
+                vgroup.add(vert_list[start:end], weight, 'ADD')
+
+    def reconstruct_normal_map(self, image):
+        """Rebuilds Z = sqrt(1 - X^2 - Y^2) from the R and G channels into B of a normal-map-only image and packs it."""
+        image.colorspace_settings.name = 'Non-Color'
+        pixels = np.empty(len(image.pixels), dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+        pixels = pixels.reshape(-1, 4)
+
+        # Remap R and G from [0, 1] to [-1, 1] for the vector math; R and G themselves stay untouched
+        x = pixels[:, 0] * 2.0 - 1.0
+        y = pixels[:, 1] * 2.0 - 1.0
+        pixels[:, 2] = np.sqrt(np.clip(1.0 - (x * x + y * y), 0.0, 1.0))
+
+        image.pixels.foreach_set(pixels.ravel())
+        # Pack so the rebuilt channel survives saving and reloading the .blend
+        image.pack()
+        image[_REBUILT_NORMAL_PROP] = True
 
     def create_texture_node(self, material, tex_name, link_socket, tex_type, is_normal_map=False, is_albedo=False):
-        if not tex_name or tex_name.lower() == "_black_texture": return None
-
+        if not tex_name or _NULL_TEXTURE_RE.search(tex_name): return None
 
-        if not (self.texture_base_path and os.path.isdir(self.texture_base_path)):
+        # Validated once when the directory was indexed
+        if not self.texture_dir_valid:
             print(f"  - FATAL ERROR: self.texture_base_path is not a valid directory.")
             print(f"    - Value is: {repr(self.texture_base_path)}")  # repr() shows hidden characters
             return None
 
-
-        target_filename_lower = (tex_name.split('/')[-1] + ".GNF").lower()
-        found_gnf_path = None
-
-        # We already know the directory is valid, so no need for a try..except here
-        for filename in os.listdir(self.texture_base_path):
-            if filename.lower() == target_filename_lower:
-                found_gnf_path = os.path.join(self.texture_base_path, filename)
-                break
+        found_gnf_path = self.find_gnf_path(tex_name)
 
         if not found_gnf_path:
-            print(f"    - ERROR: Could not find texture '{target_filename_lower}' in directory.")
+            print(f"    - ERROR: Could not find texture '{tex_name.split('/')[-1].lower()}.gnf' in directory.")
             return None
 
-        # Use the correctly-cased path from now on.
-        dds_path = self.convert_gnf_to_dds(found_gnf_path)
+        # Use the correctly-cased path from now on; materials sharing a texture reuse its image.
+        # Normal maps get their own rebuilt datablock, so color slots using the same file keep the original pixels.
+        image_key = (os.path.normcase(found_gnf_path), is_normal_map)
+        image = self.image_cache.get(image_key)
+        if image is None:
+            dds_path = self.convert_gnf_to_dds(found_gnf_path)
 
-        if not dds_path:
-            print(f"    - Failed to find or convert texture. Skipping node creation for '{tex_name}'.")
-            return None
+            if not dds_path:
+                print(f"    - Failed to find or convert texture. Skipping node creation for '{tex_name}'.")
+                return None
+
+            if is_normal_map:
+                image = bpy.data.images.load(dds_path, check_existing=False)
+                self.reconstruct_normal_map(image)
+            else:
+                image = bpy.data.images.load(dds_path, check_existing=True)
+                # check_existing matches by file path, which a rebuilt normal map from an earlier import shares
+                if image.get(_REBUILT_NORMAL_PROP):
+                    image = bpy.data.images.load(dds_path, check_existing=False)
+            self.image_cache[image_key] = image
 
-        print(f"    - Creating node for '{os.path.basename(dds_path)}' ({tex_type})")
+        print(f"    - Creating node for '{os.path.basename(image.filepath)}' ({tex_type})")
         tex_image_node = material.node_tree.nodes.new('ShaderNodeTexImage')
-        tex_image_node.image = bpy.data.images.load(dds_path, check_existing=True)
+        tex_image_node.image = image
         bsdf_node = link_socket.node
         tex_image_node.location = bsdf_node.location.x - 1200, bsdf_node.location.y
 
@@ -803,90 +1218,12 @@ class TLGReader:
             if hasattr(material, 'shadow_method'): material.shadow_method = 'HASHED'
 
         elif is_normal_map:
-            tex_image_node.image.colorspace_settings.name = 'Non-Color'
-
-            # Create all the required nodes
-            sep_color_node = material.node_tree.nodes.new('ShaderNodeSeparateColor')
-
-            # --- Remap R and G from [0, 1] to [-1, 1] for vector math ---
-            map_r_node = material.node_tree.nodes.new('ShaderNodeMapRange')
-            map_r_node.inputs['From Min'].default_value = 0.0
-            map_r_node.inputs['From Max'].default_value = 1.0
-            map_r_node.inputs['To Min'].default_value = -1.0
-            map_r_node.inputs['To Max'].default_value = 1.0
-
-            map_g_node = material.node_tree.nodes.new('ShaderNodeMapRange')
-            map_g_node.inputs['From Min'].default_value = 0.0
-            map_g_node.inputs['From Max'].default_value = 1.0
-            map_g_node.inputs['To Min'].default_value = -1.0
-            map_g_node.inputs['To Max'].default_value = 1.0
-
-            # --- Math nodes to calculate Z = sqrt(1 - X^2 - Y^2) ---
-            power_x_node = material.node_tree.nodes.new('ShaderNodeMath')
-            power_y_node = material.node_tree.nodes.new('ShaderNodeMath')
-            add_node = material.node_tree.nodes.new('ShaderNodeMath')
-            subtract_node = material.node_tree.nodes.new('ShaderNodeMath')
-            sqrt_node = material.node_tree.nodes.new('ShaderNodeMath')
-
-            power_x_node.operation = 'POWER';
-            power_x_node.inputs[1].default_value = 2.0
-            power_y_node.operation = 'POWER';
-            power_y_node.inputs[1].default_value = 2.0
-            add_node.operation = 'ADD'
-            subtract_node.operation = 'SUBTRACT';
-            subtract_node.inputs[0].default_value = 1.0;
-            subtract_node.use_clamp = True
-            sqrt_node.operation = 'SQRT'
-
-            # --- Node to recombine R, G, and new B into a final color ---
-            comb_color_node = material.node_tree.nodes.new('ShaderNodeCombineColor')
-
-            # Final Normal Map node for strength control
+            # Z is baked into the image's blue channel on load, so no reconstruction nodes are needed
             normal_map_node = material.node_tree.nodes.new('ShaderNodeNormalMap')
             normal_map_node.inputs['Strength'].default_value = 0.0
-
-            # Position nodes
-            sep_color_node.location = tex_image_node.location + Vector((200, 0))
-            map_r_node.location = sep_color_node.location + Vector((180, 80))
-            map_g_node.location = sep_color_node.location + Vector((180, -80))
-            power_x_node.location = map_r_node.location + Vector((180, 0))
-            power_y_node.location = map_g_node.location + Vector((180, 0))
-            add_node.location = power_x_node.location + Vector((180, -40))
-            subtract_node.location = add_node.location + Vector((180, 0))
-            sqrt_node.location = subtract_node.location + Vector((180, 0))
-            comb_color_node.location = sqrt_node.location + Vector((200, 40))
-            normal_map_node.location = comb_color_node.location + Vector((200, 0))
-
-            # Link the node chain
-            links = material.node_tree.links
-            links.new(tex_image_node.outputs['Color'], sep_color_node.inputs['Color'])
-
-            # Remap R and G to vector space [-1, 1]
-            links.new(sep_color_node.outputs['Red'], map_r_node.inputs['Value'])
-            links.new(sep_color_node.outputs['Green'], map_g_node.inputs['Value'])
-
-            # Calculate X^2 and Y^2
-            links.new(map_r_node.outputs['Result'], power_x_node.inputs[0])
-            links.new(map_g_node.outputs['Result'], power_y_node.inputs[0])
-
-            # Calculate X^2 + Y^2
-            links.new(power_x_node.outputs['Value'], add_node.inputs[0])
-            links.new(power_y_node.outputs['Value'], add_node.inputs[1])
-
-            # Calculate 1 - (X^2 + Y^2)
-            links.new(add_node.outputs['Value'], subtract_node.inputs[1])
-
-            # Calculate Z = sqrt(...)
-            links.new(subtract_node.outputs['Value'], sqrt_node.inputs[0])
-
-            # Combine original R, G, and the reconstructed B (Z)
-            links.new(sep_color_node.outputs['Red'], comb_color_node.inputs['Red'])
-            links.new(sep_color_node.outputs['Green'], comb_color_node.inputs['Green'])
-            links.new(sqrt_node.outputs['Value'], comb_color_node.inputs['Blue'])
-
-            # Final connection to the shader
-            links.new(comb_color_node.outputs['Color'], normal_map_node.inputs['Color'])
-            links.new(normal_map_node.outputs['Normal'], link_socket)
+            normal_map_node.location = tex_image_node.location + Vector((300, 0))
+            material.node_tree.links.new(tex_image_node.outputs['Color'], normal_map_node.inputs['Color'])
+            material.node_tree.links.new(normal_map_node.outputs['Normal'], link_socket)
 
         elif tex_type == "Subsurface":
             sep_node = material.node_tree.nodes.new('ShaderNodeSeparateColor')
@@ -898,61 +1235,57 @@ class TLGReader:
 
     def find_texture_path(self):
         print("--- Searching for texture directory ---")
-        try:
-            model_dir = os.path.normpath(os.path.dirname(self.filepath))
-            parts = model_dir.split(os.sep)
+        model_dir = os.path.normpath(os.path.dirname(self.filepath))
+        parts = model_dir.split(os.sep)
 
-            # Find the base 'GAME' directory
-            game_index = [p.upper() for p in parts].index('GAME')
-            game_dir = os.sep.join(parts[:game_index + 1])
-
-            # Get the path components after GAME (e.g., ['ASSETS', 'CHARA', 'SKIN', 'CONDORA'])
-            path_components = parts[game_index + 1:]
-
-            texture_path = None
+        # Find the base 'GAME' directory
+        upper_parts = [p.upper() for p in parts]
+        if 'GAME' not in upper_parts:
+            print("  - WARNING: Could not find GAME directory in path")
+            return None
+        game_index = upper_parts.index('GAME')
+        game_dir = os.sep.join(parts[:game_index + 1])
 
-            # Specifically handle the character skin path structure:
-            # From: ASSETS/CHARA/SKIN/MODEL_NAME
-            # To:   TEXTURES/CHARA/MODEL_NAME
-            if (len(path_components) >= 4 and
-                    path_components[0].upper() == 'ASSETS' and
-                    path_components[1].upper() == 'CHARA' and
-                    path_components[2].upper() == 'SKIN'):
+        # Get the path components after GAME (e.g., ['ASSETS', 'CHARA', 'SKIN', 'CONDORA'])
+        path_components = parts[game_index + 1:]
 
-                model_variant_name = path_components[3]  # e.g., 'CONDORA'
+        texture_path = None
 
-                # Special case only for 'CONDORA' to handle the name mismatch.
-                if model_variant_name.upper() == 'CONDORA':
-                    base_model_name = 'CONDOR'
-                else:
-                    # For all other models, use the name as-is.
-                    base_model_name = model_variant_name
+        # Specifically handle the character skin path structure:
+        # From: ASSETS/CHARA/SKIN/MODEL_NAME
+        # To:   TEXTURES/CHARA/MODEL_NAME
+        if (len(path_components) >= 4 and
+                path_components[0].upper() == 'ASSETS' and
+                path_components[1].upper() == 'CHARA' and
+                path_components[2].upper() == 'SKIN'):
 
-                # Construct the correct path
-                texture_path = os.path.join(game_dir, 'TEXTURES', path_components[1], base_model_name)
+            model_variant_name = path_components[3]  # e.g., 'CONDORA'
 
+            # Special case only for 'CONDORA' to handle the name mismatch.
+            if model_variant_name.upper() == 'CONDORA':
+                base_model_name = 'CONDOR'
             else:
-                # Fallback for other asset types (replaces ASSETS with TEXTURES)
-                try:
-                    assets_index = path_components.index('ASSETS')
-                    path_components[assets_index] = 'TEXTURES'
-                    texture_path = os.path.join(game_dir, *path_components)
-                except ValueError:
-                    print("  - WARNING: Could not determine texture path via fallback.")
-                    return None
+                # For all other models, use the name as-is.
+                base_model_name = model_variant_name
 
-            # Final validation
-            if texture_path and os.path.isdir(texture_path):
-                final_path = os.path.normpath(texture_path)
-                print(f"  - SUCCESS: Found and validated texture path: {final_path}")
-                return final_path
-            else:
-                print(f"  - WARNING: Constructed texture path is not a valid directory: {texture_path}")
-                return None
+            # Construct the correct path
+            texture_path = os.path.join(game_dir, 'TEXTURES', path_components[1], base_model_name)
 
-        except Exception as e:
-            print(f"  - ERROR: An unexpected error occurred in find_texture_path: {e}")
-            traceback.print_exc()
+        else:
+            # Fallback for other asset types (replaces ASSETS with TEXTURES)
+            if 'ASSETS' not in path_components:
+                print("  - WARNING: Could not determine texture path via fallback.")
+                return None
+            path_components[path_components.index('ASSETS')] = 'TEXTURES'
+            texture_path = os.path.join(game_dir, *path_components)
+
+        # Final validation
+        if texture_path and os.path.isdir(texture_path):
+            final_path = os.path.normpath(texture_path)
+            print(f"  - SUCCESS: Found and validated texture path: {final_path}")
+            return final_path
+        else:
+            print(f"  - WARNING: Constructed texture path is not a valid directory: {texture_path}")
             return None
 
     def build_skeleton(self, skel_obj):
@@ -974,76 +1307,85 @@ class TLGReader:
                 created_bones[bone_ref] = edit_bone
                 bone_data_map[bone_ref] = bone_data
 
-        for bone_ref, edit_bone in created_bones.items():
-            bone_data = bone_data_map[bone_ref]
+        # Compute every head, tail and roll axis in one pass; the rotated Y and Z axes are the matrix columns
+        bone_datas = list(bone_data_map.values())
+        heads = np.array([bone_data.rootPosition for bone_data in bone_datas], dtype=np.float64).reshape(-1, 3)
+        heads *= self.scale
+        quats_xyzw = np.array([bone_data.rootRotation for bone_data in bone_datas], dtype=np.float64).reshape(-1, 4)
+        rot_mats = _quats_to_mat3(quats_xyzw[:, [3, 0, 1, 2]])
+        tails = heads + rot_mats[:, :, 1] * max(0.01 * self.scale, 0.01)
+        z_axes = rot_mats[:, :, 2]
+
+        for (bone_ref, edit_bone), bone_data, head, tail, z_axis in zip(
+                created_bones.items(), bone_datas, heads.tolist(), tails.tolist(), z_axes.tolist()):
             parent_ref = bone_data.parent.name
             if parent_ref in created_bones and edit_bone != created_bones[parent_ref]:
                 edit_bone.parent = created_bones[parent_ref]
-            pos = Vector(bone_data.rootPosition) * self.scale
-            q_xyzw = bone_data.rootRotation
-            rot = Quaternion((q_xyzw[3], q_xyzw[0], q_xyzw[1], q_xyzw[2]))
-            y_axis = rot @ Vector((0.0, 1.0, 0.0))
-            z_axis = rot @ Vector((0.0, 0.0, 1.0))
-            edit_bone.head = pos
-            edit_bone.tail = edit_bone.head + y_axis * max(0.01 * self.scale, 0.01)
+            edit_bone.head = head
+            edit_bone.tail = tail
             edit_bone.align_roll(z_axis)
 
         bpy.ops.object.mode_set(mode='OBJECT')
         self.armature_object = arm_obj
 
-    def get_data_buffer(self, path, buffer_type):
+    def read_data_header(self, f, path):
+        """Reads and validates a .data file's CDAT header, returning (stride, length) or None."""
+        header = f.read(_CDAT_HEADER.size)
+        if len(header) < _CDAT_HEADER.size:
+            print(f"  - WARNING: Incomplete header in data buffer: {path}")
+            return None
+
+        cdat, _, _, stride, length = _CDAT_HEADER.unpack(header)
+        if cdat != b'CDAT':
+            print(f"  - WARNING: Invalid CDAT header in data buffer: {path}")
+            return None
+        return stride, length
+
+    def get_geometry_buffer(self, path):
+        """Reads a GEOMETRY .data file into scaled float32 (N, 3) positions and (N, 2) UVs with V flipped for Blender."""
         if not os.path.exists(path):
             print(f"  - WARNING: Data buffer file not found: {path}")
             return None
 
         try:
             with open(path, 'rb') as f:
-                header = f.read(16)
-                if len(header) < 16:
-                    print("  - WARNING: Incomplete header in data buffer")
+                header = self.read_data_header(f, path)
+                if not header or header[0] != _GEOMETRY_VERTEX.itemsize: return None
+                num_verts = header[1] // _GEOMETRY_VERTEX.itemsize
+
+                # Position (3 floats), normal and padding (12 bytes), UV coordinates (2 floats)
+                verts_arr = np.fromfile(f, dtype=_GEOMETRY_VERTEX, count=num_verts)
+                if len(verts_arr) < num_verts:
+                    print(f"  - WARNING: Truncated data buffer: {path}")
                     return None
+                verts = (verts_arr['pos'].astype(np.float64) * self.scale).astype(np.float32)
+                uvs = np.ascontiguousarray(verts_arr['uv'])
+                uvs[:, 1] = 1.0 - uvs[:, 1]
+                return verts, uvs
 
-                cdat, _, _, stride, length = struct.unpack('<4shhii', header)
-                if cdat != b'CDAT':
-                    print("  - WARNING: Invalid CDAT header in data buffer")
-                    return None
-
-                if buffer_type == "GEOMETRY" and stride == 0x20:
-                    verts, uvs = [], []
-
-                    # Read vertex data
-                    for _ in range(length // stride):
-                        # Position (3 floats)
-                        vx = struct.unpack('<f', f.read(4))[0]
-                        vy = struct.unpack('<f', f.read(4))[0]
-                        vz = struct.unpack('<f', f.read(4))[0]
-
-                        # Skip normal and padding (4 bytes normal + 8 bytes padding)
-                        f.read(12)
-
-                        # UV coordinates (2 floats)
-                        u = struct.unpack('<f', f.read(4))[0]
-                        v = struct.unpack('<f', f.read(4))[0]
-
-                        verts.append((vx * self.scale, vy * self.scale, vz * self.scale))
-                        uvs.append((u, v))
+        except Exception as e:
+            print(f"  - ERROR reading data buffer: {e}")
+            traceback.print_exc()
 
-                    return {"verts": verts, "uvs": uvs}
+        return None
 
-                elif buffer_type == "ELEMS" and stride == 0x02:
-                    faces = []
-                    # Calculate number of faces
-                    num_faces = length // (stride * 3)
+    def get_index_buffer(self, path):
+        """Reads an ELEMS .data file into int32 (F, 3) triangles with the winding reversed for Blender."""
+        if not os.path.exists(path):
+            print(f"  - WARNING: Data buffer file not found: {path}")
+            return None
 
-                    # Read triangle indices
-                    for _ in range(num_faces):
-                        fa = struct.unpack('<H', f.read(2))[0]
-                        fb = struct.unpack('<H', f.read(2))[0]
-                        fc = struct.unpack('<H', f.read(2))[0]
-                        # Reverse winding order for Blender
-                        faces.append((fa, fc, fb))
+        try:
+            with open(path, 'rb') as f:
+                header = self.read_data_header(f, path)
+                if not header or header[0] != 0x02: return None
+                num_faces = header[1] // 6
 
-                    return {"faces": faces}
+                elems = np.fromfile(f, dtype='<u2', count=num_faces * 3)
+                if len(elems) < num_faces * 3:
+                    print(f"  - WARNING: Truncated data buffer: {path}")
+                    return None
+                return elems.reshape(num_faces, 3)[:, [0, 2, 1]].astype(np.int32)
 
         except Exception as e:
             print(f"  - ERROR reading data buffer: {e}")
@@ -1052,35 +1394,36 @@ class TLGReader:
         return None
 
     def read_long(self, count=1):
-        try:
-            fmt, size = f'<{count}i', 4 * count;
-            data = self.file.read(size)
-            if len(data) < size: return None if count == 1 else []
-            res = struct.unpack(fmt, data);
-            return res[0] if count == 1 else list(res)
-        except:
-            return None if count == 1 else []
+        fmt = _INT32_ARRAYS.get(count) or _get_struct(f'<{count}i')
+        size = fmt.size
+        if self.pos + size > len(self.buf): return None if count == 1 else []
+        res = fmt.unpack_from(self.buf, self.pos)
+        self.pos += size
+        return res[0] if count == 1 else list(res)
+
+    def read_long_list(self, count):
+        """Reads count int32 values in one unpack; returns () if they would run past the end of the buffer."""
+        if count <= 0: return ()
+        fmt = _INT32_ARRAYS.get(count) or _get_struct(f'<{count}i')
+        if self.pos + fmt.size > len(self.buf): return ()
+        values = fmt.unpack_from(self.buf, self.pos)
+        self.pos += fmt.size
+        return values
 
     def read_float(self, count=1):
-        try:
-            fmt, size = f'<{count}f', 4 * count;
-            data = self.file.read(size)
-            if len(data) < size: return 0.0 if count == 1 else [0.0] * count
-            res = struct.unpack(fmt, data);
-            return res[0] if count == 1 else list(res)
-        except:
-            return 0.0 if count == 1 else [0.0] * count
-
-    def read_fixed_string(self, length):
-        if length <= 0: return ""
-        return self.file.read(length).split(b'\x00', 1)[0].decode('utf-8', 'ignore')
+        fmt = _FLOAT32_ARRAYS.get(count) or _get_struct(f'<{count}f')
+        size = fmt.size
+        if self.pos + size > len(self.buf): return 0.0 if count == 1 else [0.0] * count
+        res = fmt.unpack_from(self.buf, self.pos)
+        self.pos += size
+        return res[0] if count == 1 else list(res)
 
     def get_obj_struct(self, obj_type):
-        cls_map = {"SceneRoot": SceneRoot, "Skeleton": Skeleton, "Bone": Bone, "Mesh": Mesh, "RenderExt": RenderExt,
-                   "SkinCluster": SkinCluster, "GeometryBuffer": GeometryBuffer,
-                   "MaterialDefinition": MaterialDefinition,
-                   "RenderBatch": RenderBatch, "Texture": Texture}
-        return cls_map.get(obj_type, type(obj_type, (object,), {"name": "", "type": obj_type}))()
+        cls = _OBJECT_CLASSES.get(obj_type)
+        if cls is None:
+            # Unknown types get a named UnknownObject subclass, created once and reused
+            cls = _OBJECT_CLASSES[obj_type] = type(obj_type, (UnknownObject,), {"__slots__": ()})
+        return cls()
 
 
 # --- Blender UI and Registration ---
@@ -1098,6 +1441,11 @@ class ImportTLGAnim(bpy.types.Operator, ImportHelper):
         description="Global scale for the animation (should match model import scale)",
         default=1.0,
     )
+    profile: BoolProperty(
+        name="Profile",
+        description="Print a cProfile report for each animation to the system console",
+        default=False,
+    )
 
     def execute(self, context):
         armature = self.find_armature(context)
@@ -1108,8 +1456,8 @@ class ImportTLGAnim(bpy.types.Operator, ImportHelper):
         try:
             # This is the crucial part:
             # 1. Create an instance of the reader
-            reader = TLGAnimReader(self.filepath, armature, context, self.scale)
-            # 2. Call the .read() method to start the import and profiling
+            reader = TLGAnimReader(self.filepath, armature, context, self.scale, self.profile)
+            # 2. Call the .read() method to start the import (and profiling, if enabled)
             return reader.read()
         except Exception as e:
             self.report({'ERROR'}, f"Failed to import animation: {e}. See console for details.")
@@ -1131,98 +1479,85 @@ class TLGAnimReader:
     and applies them to a selected armature.
     """
 
-    def __init__(self, filepath, armature, context, scale):
+    def __init__(self, filepath, armature, context, scale, profile=False):
         self.filepath = filepath
         self.armature = armature
         self.context = context
         self.global_scale = scale
+        self.profile = profile
+        # Bone name -> (rest rotation, rest translation) of its inverse local rest matrix, or None if not on the armature
+        self.rest_pose_cache = {}
         self.raw_data = None
         # This list will hold the parsed data for one or more animations.
         self.animations = []
 
     def read(self):
         """
-        Main entry point. This version correctly interleaves parsing, applying,
-        and profiling for each animation individually.
+        Main entry point. Parses and applies each animation in turn,
+        optionally profiling each one individually.
         """
+        # Mode to return to if the import fails after switching to pose mode
+        restore_mode = None
         try:
-            print("--- Starting Animation Import (Corrected Per-Animation Profiling) ---")
+            print("--- Starting Animation Import ---")
+            # Map the file instead of reading it; slices, unpacks and np.frombuffer all work on the map
             with open(self.filepath, 'rb') as f:
-                self.raw_data = f.read()
+                self.raw_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
             if self.raw_data[0:4] != b'CDAT':
                 raise ValueError("Invalid magic number. Expected 'CDAT'.")
 
-            field_0x10 = struct.unpack('<I', self.raw_data[0x10:0x14])[0]
+            field_0x10 = _ANIM_POINTER.unpack_from(self.raw_data, 0x10)[0]
             is_multi_animation = field_0x10 > 200
 
+            # Switch to pose mode once for all animations rather than once per action
+            if self.armature.mode != 'POSE':
+                restore_mode = self.armature.mode
+                bpy.ops.object.mode_set(mode='POSE')
+
             if is_multi_animation:
                 print("Parsing as Multi-Animation File...")
                 num_anims = field_0x10
 
-                # Get main header pointers
-                p_name_list = struct.unpack('<I', self.raw_data[0x18:0x1C])[0]
-                p_anim_offsets = struct.unpack('<I', self.raw_data[0x20:0x24])[0]
-                p_anim_info_base = struct.unpack('<I', self.raw_data[0x24:0x28])[0]
-
-                POINTER_FIX = 16
-                addr_anim_offsets_list = p_anim_offsets + POINTER_FIX
-                addr_anim_info_block = p_anim_info_base + POINTER_FIX
-                addr_name_offsets_list = 0x30
+                # Per-animation profiling is opt-in; the profiler modules are only imported when it's on
+                profile = self.profile
+                if profile:
+                    import cProfile, pstats, io
 
                 # --- THIS IS NOW THE MAIN LOOP ---
-                for i in range(num_anims):
+                for anim_data, num_entries, current_anim_base_addr in self._iter_multi_animations(num_anims):
                     # Create and enable the profiler to measure everything for this one animation
-                    pr = cProfile.Profile()
-                    pr.enable()
-
-                    # 1. PARSE a single animation's info
-                    name_rel_offset = struct.unpack('<I', self.raw_data[
-                                                          addr_name_offsets_list + i * 4: addr_name_offsets_list + (
-                                                                      i + 1) * 4])[0]
-                    name_addr = p_name_list + POINTER_FIX + name_rel_offset
-                    anim_name_full = self.raw_data[name_addr:].split(b'\0', 1)[0].decode('ascii', 'ignore')
-                    anim_name = anim_name_full.split('/')[-1]
-
-                    info_offset = struct.unpack('<I', self.raw_data[
-                                                      addr_anim_offsets_list + i * 4: addr_anim_offsets_list + (
-                                                                  i + 1) * 4])[0]
-                    current_anim_base_addr = addr_anim_info_block + info_offset
-
-                    frame_rate, _, num_entries, frame_count = struct.unpack('<IfII', self.raw_data[
-                                                                                     current_anim_base_addr: current_anim_base_addr + 16])
-
-                    anim_data = {
-                        'name': anim_name if anim_name else f"animation_{i}",
-                        'frame_count': frame_count,
-                        'frame_rate': frame_rate or 30,
-                    }
-                    print(
-                        f"\n--- Processing animation: '{anim_data['name']}' ({num_entries} Tracks, {frame_count} Frames) ---")
-
-                    # 2. PARSE THE TRACK DATA (This is the suspected slow part)
+                    if profile:
+                        pr = cProfile.Profile()
+                        pr.enable()
+
+                    print(f"\n--- Processing animation: '{anim_data['name']}' "
+                          f"({num_entries} Tracks, {anim_data['frame_count']} Frames) ---")
+
+                    # 1. PARSE THE TRACK DATA
                     anim_data['tracks'] = self._parse_tracks(
                         num_entries=num_entries,
-                        num_frames=frame_count,
+                        num_frames=anim_data['frame_count'],
                         info_table_start=32,
                         base_addr=current_anim_base_addr,
                         offset_fix=0
                     )
 
-                    # 3. APPLY THE KEYFRAMES
+                    # 2. APPLY THE KEYFRAMES
                     self.apply_animation_to_bones(anim_data)
 
-                    # 4. STOP PROFILING and print the report
-                    pr.disable()
-                    s = io.StringIO()
-                    ps = pstats.Stats(pr, stream=s).sort_stats('tottime')
-                    ps.print_stats(30)
+                    # 3. STOP PROFILING and print the report
+                    if profile:
+                        pr.disable()
+                        s = io.StringIO()
+                        ps = pstats.Stats(pr, stream=s).sort_stats('tottime')
+                        ps.print_stats(30)
 
-                    print("\n" + "=" * 80)
-                    print(f"PROFILING REPORT FOR: '{anim_data['name']}'")
-                    print("=" * 80)
-                    print(s.getvalue())
-                    print("=" * 80 + "\n")
+                        print("\n" + "=" * 80)
+                        print(f"PROFILING REPORT FOR: '{anim_data['name']}'")
+                        print("=" * 80)
+                        print(s.getvalue())
+                        print("=" * 80 + "\n")
 
             else:  # Handle single animation file
                 print("Parsing as Single-Animation File...")
@@ -1231,20 +1566,33 @@ class TLGAnimReader:
                 if self.animations:
                     self.apply_animation_to_bones(self.animations[0])
 
+            bpy.ops.object.mode_set(mode='OBJECT')
+            restore_mode = None
+
         except (ValueError, struct.error, IndexError) as e:
             print(f"An error occurred during parsing: {e}")
             traceback.print_exc()
             return {'CANCELLED'}
+        finally:
+            if restore_mode and self.armature.mode != restore_mode:
+                bpy.ops.object.mode_set(mode=restore_mode)
+            if self.raw_data is not None:
+                self.raw_data.close()
+                self.raw_data = None
 
         print(f"\n--- Full import process finished. ---")
         return {'FINISHED'}
 
+    def _read_c_string(self, addr, max_len=None):
+        """Decodes the null-terminated string at addr straight from the map; max_len caps an unterminated one."""
+        end = self.raw_data.find(b'\0', addr)
+        if end == -1:
+            end = len(self.raw_data) if max_len is None else addr + max_len
+        return str(memoryview(self.raw_data)[addr:end], 'ascii', 'ignore')
+
     def _parse_single_animation_file(self):
         """Parses a file containing a single animation."""
-        header_format = '<4s12xIfII'
-        _, frame_rate, _, num_entries, frame_count = struct.unpack(
-            header_format, self.raw_data[:struct.calcsize(header_format)]
-        )
+        _, frame_rate, _, num_entries, frame_count = _ANIM_SINGLE_HEADER.unpack_from(self.raw_data)
 
         anim_data = {
             'name': os.path.splitext(os.path.basename(self.filepath))[0],
@@ -1263,12 +1611,12 @@ class TLGAnimReader:
         )
         self.animations.append(anim_data)
 
-    def _parse_multi_animation_file(self, num_anims):
-        """Parses a file containing multiple animations."""
+    def _iter_multi_animations(self, num_anims):
+        """Yields (anim_data, num_entries, base_addr) for each animation header of a multi-animation file."""
         # Correctly unpack each pointer from its specific 4-byte address.
-        p_name_list = struct.unpack('<I', self.raw_data[0x18:0x1C])[0]
-        p_anim_offsets = struct.unpack('<I', self.raw_data[0x20:0x24])[0]
-        p_anim_info_base = struct.unpack('<I', self.raw_data[0x24:0x28])[0]
+        p_name_list = _ANIM_POINTER.unpack_from(self.raw_data, 0x18)[0]
+        p_anim_offsets = _ANIM_POINTER.unpack_from(self.raw_data, 0x20)[0]
+        p_anim_info_base = _ANIM_POINTER.unpack_from(self.raw_data, 0x24)[0]
 
         POINTER_FIX = 16  # This offset applies to the main header pointers
         addr_anim_offsets_list = p_anim_offsets + POINTER_FIX
@@ -1277,104 +1625,94 @@ class TLGAnimReader:
 
         for i in range(num_anims):
             # 1. Get the animation's name
-            name_rel_offset = \
-            struct.unpack('<I', self.raw_data[addr_name_offsets_list + i * 4: addr_name_offsets_list + (i + 1) * 4])[0]
+            name_rel_offset = _ANIM_POINTER.unpack_from(self.raw_data, addr_name_offsets_list + i * 4)[0]
             name_addr = p_name_list + POINTER_FIX + name_rel_offset
-            anim_name_full = self.raw_data[name_addr:].split(b'\0', 1)[0].decode('ascii', 'ignore')
+            anim_name_full = self._read_c_string(name_addr)
             anim_name = anim_name_full.split('/')[-1]
 
             # 2. Get the base address for this specific animation's info table
-            info_offset = \
-            struct.unpack('<I', self.raw_data[addr_anim_offsets_list + i * 4: addr_anim_offsets_list + (i + 1) * 4])[0]
+            info_offset = _ANIM_POINTER.unpack_from(self.raw_data, addr_anim_offsets_list + i * 4)[0]
             current_anim_base_addr = addr_anim_info_block + info_offset
 
             # 3. Parse this animation's specific 32-byte header
-            frame_rate, _, num_entries, frame_count = struct.unpack('<IfII', self.raw_data[
-                                                                             current_anim_base_addr: current_anim_base_addr + 16])
+            frame_rate, _, num_entries, frame_count = _ANIM_INFO.unpack_from(self.raw_data, current_anim_base_addr)
 
             anim_data = {
                 'name': anim_name if anim_name else f"animation_{i}",
                 'frame_count': frame_count,
                 'frame_rate': frame_rate or 30,
             }
-            print(f"  - Found animation '{anim_data['name']}' ({num_entries} Tracks, {frame_count} Frames)")
-
-            # 4. Parse the tracks for this animation. Pointers are relative to its base address.
-            anim_data['tracks'] = self._parse_tracks(
-                num_entries=num_entries,
-                num_frames=frame_count,
-                info_table_start=32,  # Track list starts after the 32-byte anim-specific header
-                base_addr=current_anim_base_addr,
-                offset_fix=0  # No +16 fix for multi-anim track pointers
-            )
-            self.animations.append(anim_data)
+            yield anim_data, num_entries, current_anim_base_addr
 
     def _parse_tracks(self, num_entries, num_frames, info_table_start, base_addr, offset_fix):
         """Generic method to read track metadata and cache animation data."""
         animation_data_cache = {}
-        for i in range(num_entries):
-            entry_offset = base_addr + info_table_start + (i * 32)
-            flag, ptr_trans, ptr_rot, ptr_scale, ptr_bone_name = struct.unpack('<IIIII', self.raw_data[
-                                                                                         entry_offset: entry_offset + 20])
-
-            bone_name_addr = base_addr + ptr_bone_name + offset_fix
-
-            # Find the end of the string without slicing the whole file
-            end_index = self.raw_data.find(b'\0', bone_name_addr)
-            if end_index != -1:
-                # Slice only the part we need
-                bone_name_bytes = self.raw_data[bone_name_addr:end_index]
-            else:
-                # Fallback in case a name is not null-terminated (unlikely)
-                bone_name_bytes = self.raw_data[bone_name_addr:bone_name_addr + 128]
-
-            bone_name = bone_name_bytes.decode('ascii', 'ignore')
+        # View the whole info table at once; entries are 32 bytes apart but only the first 20 are used
+        entries = np.ndarray((num_entries,), dtype=_ANIM_TRACK_ENTRY, buffer=self.raw_data,
+                             offset=base_addr + info_table_start, strides=(32,))
+        for flag, ptr_trans, ptr_rot, ptr_scale, ptr_bone_name in zip(
+                *(entries[field].tolist() for field in _ANIM_TRACK_ENTRY.names)):
 
+            bone_name = self._read_c_string(base_addr + ptr_bone_name + offset_fix, 128)
 
             # Determine key counts based on the track flag
-            trans_keys = num_frames if flag in [0, 3, 4, 5] else 1
-            rot_keys = num_frames if flag in [0, 4, 6] else 1
-            scale_keys = num_frames if flag in [0, 3] else 1
+            trans_keys = num_frames if (_FULL_TRANS_FLAGS >> flag) & 1 else 1
+            rot_keys = num_frames if (_FULL_ROT_FLAGS >> flag) & 1 else 1
+            scale_keys = num_frames if (_FULL_SCALE_FLAGS >> flag) & 1 else 1
 
             animation_data_cache[bone_name] = {
-                'T': self._unpack_data(base_addr + ptr_trans + offset_fix, trans_keys, 'vec3'),
-                'R': self._unpack_data(base_addr + ptr_rot + offset_fix, rot_keys, 'quat'),
-                'S': self._unpack_data(base_addr + ptr_scale + offset_fix, scale_keys, 'vec3')
+                'T': self._unpack_vec3(base_addr + ptr_trans + offset_fix, trans_keys),
+                'R': self._unpack_quat(base_addr + ptr_rot + offset_fix, rot_keys),
+                'S': self._unpack_vec3(base_addr + ptr_scale + offset_fix, scale_keys)
             }
         return animation_data_cache
 
-    def _unpack_data(self, start_offset, num_keys, data_type):
-        """Unpacks a raw block of vec3/quat animation data."""
-        values = []
-        bytes_to_read = 12 * num_keys
-        if start_offset + bytes_to_read > len(self.raw_data):
-            # Return default value if data is out of bounds
-            return [Vector((0, 0, 0))] if data_type == 'vec3' else [Quaternion((1, 0, 0, 0))]
-
-        data_block = self.raw_data[start_offset: start_offset + bytes_to_read]
-        for i in range(num_keys):
-            chunk = data_block[i * 12: (i + 1) * 12]
-            try:
-                x, y, z = struct.unpack('<fff', chunk)
-                if data_type == 'vec3':
-                    values.append(Vector((x, y, z)))
-                elif data_type == 'quat':
-                    mag_sq = x * x + y * y + z * z
-                    w = math.sqrt(1.0 - min(1.0, mag_sq)) if mag_sq <= 1.001 else 0.0
-                    values.append(Quaternion((w, x, y, z)))
-            except struct.error:
-                # Append default value on unpacking error
-                values.append(Vector((0, 0, 0)) if data_type == 'vec3' else Quaternion((1, 0, 0, 0)))
-        return values
+    def _unpack_vec3(self, start_offset, num_keys):
+        """Unpacks a raw block of vec3 animation keys into an (N, 3) array, or one zero key if out of bounds."""
+        if start_offset + 12 * num_keys > len(self.raw_data):
+            return np.zeros((1, 3))
+
+        values = np.frombuffer(self.raw_data, dtype='<f4', count=num_keys * 3, offset=start_offset)
+        return values.astype(np.float64).reshape(num_keys, 3)
+
+    def _unpack_quat(self, start_offset, num_keys):
+        """Unpacks a raw block of xyz rotation keys into an (N, 4) wxyz array, or one identity key if out of bounds."""
+        if start_offset + 12 * num_keys > len(self.raw_data):
+            return np.array([[1.0, 0.0, 0.0, 0.0]])
+
+        # Quaternions are stored as xyz; rebuild w, zeroing it for keys whose xyz is already over unit length
+        values = self._unpack_vec3(start_offset, num_keys)
+        mag_sq = np.einsum('ij,ij->i', values, values)
+        w = np.where(mag_sq <= 1.001, np.sqrt(1.0 - np.minimum(1.0, mag_sq)), 0.0)
+        quats = np.column_stack((w, values))
+        # Keys whose xyz exceeded unit length come out longer than 1; scale every key back onto the unit sphere
+        return quats / np.sqrt(np.maximum(mag_sq + w * w, 1e-12))[:, None]
+
+    def get_rest_pose(self, bone_name):
+        """Returns the bone's inverse local rest rotation and translation, computed once per reader."""
+        if bone_name in self.rest_pose_cache:
+            return self.rest_pose_cache[bone_name]
+
+        pose_bone = self.armature.pose.bones.get(bone_name)
+        if not pose_bone:
+            self.rest_pose_cache[bone_name] = None
+            return None
+
+        # Inverse of the bone's rest matrix relative to its parent: (P^-1 @ L)^-1 == L^-1 @ P, identity for roots.
+        # Solving L @ X = P gives L^-1 @ P directly, without forming the inverse.
+        if not pose_bone.parent:
+            rest_inv = np.identity(4)
+        else:
+            rest_inv = np.linalg.solve(np.array(pose_bone.bone.matrix_local),
+                                       np.array(pose_bone.parent.bone.matrix_local))
+        rest_pose = self.rest_pose_cache[bone_name] = (np.ascontiguousarray(rest_inv[:3, :3]), rest_inv[:3, 3].copy())
+        return rest_pose
 
     def apply_animation_to_bones(self, anim_data):
         """
         Calculates and applies local keyframes for a single animation action.
         This version hoists invariant matrix math out of the main loop for maximum speed.
         """
-        if self.armature.mode != 'POSE':
-            bpy.ops.object.mode_set(mode='POSE')
-
         action = bpy.data.actions.new(name=anim_data['name'])
         if not self.armature.animation_data:
             self.armature.animation_data_create()
@@ -1386,73 +1724,63 @@ class TLGAnimReader:
 
         track_data_cache = anim_data['tracks']
 
-        for bone_name, track_data in track_data_cache.items():
-            pose_bone = self.armature.pose.bones.get(bone_name)
-            if not pose_bone:
-                continue
-
-
-            if not pose_bone.parent:
-                mat_parent_rest_inv = pose_bone.bone.matrix_local.inverted()
-            else:
-                mat_parent_rest_inv = pose_bone.parent.bone.matrix_local.inverted()
-
-            mat_rest_local = mat_parent_rest_inv @ pose_bone.bone.matrix_local
-            mat_rest_local_inv = mat_rest_local.inverted()
-
-            # --- 1. Use NumPy to pre-allocate arrays for all transform data ---
-            locations = np.empty((num_frames, 3), dtype=np.float32)
-            rotations = np.empty((num_frames, 4), dtype=np.float32)
-            scales = np.empty((num_frames, 3), dtype=np.float32)
-
-            # --- 2. Calculate all transforms and fill the NumPy arrays ---
-            for frame_idx in range(num_frames):
-                t_idx = frame_idx if len(track_data['T']) > 1 else 0
-                r_idx = frame_idx if len(track_data['R']) > 1 else 0
-                s_idx = frame_idx if len(track_data['S']) > 1 else 0
-
-                loc_data = track_data['T'][t_idx] * self.global_scale
-                rot_data = track_data['R'][r_idx]
-                scl_data = track_data['S'][s_idx]
-
-                # This is now much faster as we use the pre-calculated inverse
-                mat_anim_local = Matrix.Translation(loc_data) @ rot_data.to_matrix().to_4x4()
-                mat_pose_delta = mat_rest_local_inv @ mat_anim_local
-
-                key_loc, key_rot, _ = mat_pose_delta.decompose()
-
-                locations[frame_idx] = key_loc
-                rotations[frame_idx] = key_rot
-                scales[frame_idx] = scl_data
-
-            # --- 3. Batch-load keyframes from the prepared NumPy arrays ---
-            frames = np.arange(1, num_frames + 1, dtype=np.float32)
-
-            def batch_load_fcurves(fcurves, data_array):
-                if not fcurves: return
-                coords = np.empty(num_frames * 2, dtype=np.float32)
-                coords[0::2] = frames
-                for i in range(data_array.shape[1]):
-                    fcurve = fcurves[i]
+        # Shared by every fcurve: frame numbers in the even slots, values filled into the odd slots
+        frames = np.arange(1, num_frames + 1, dtype=np.float32)
+        coords = np.empty(num_frames * 2, dtype=np.float32)
+        coords[0::2] = frames
+
+        def batch_load_fcurves(fcurves, data_array):
+            # Channels that never change (including single-key tracks) get one CONSTANT keyframe
+            # instead of num_frames identical ones
+            if not fcurves: return
+            constant = np.ptp(data_array, axis=0) <= _CONSTANT_CHANNEL_EPSILON
+            for i in range(data_array.shape[1]):
+                fcurve = fcurves[i]
+                if constant[i]:
+                    fcurve.keyframe_points.add(1)
+                    fcurve.keyframe_points.foreach_set("co", (1.0, data_array[0, i]))
+                    fcurve.keyframe_points[0].interpolation = 'CONSTANT'
+                else:
                     coords[1::2] = data_array[:, i]
                     fcurve.keyframe_points.add(num_frames)
                     fcurve.keyframe_points.foreach_set("co", coords)
-                    fcurve.update()
-
-            loc_fcurves = [action.fcurves.new(data_path=f'pose.bones["{bone_name}"].location', index=i) for i in
-                           range(3)]
-            batch_load_fcurves(loc_fcurves, locations)
-
-            rot_fcurves = [action.fcurves.new(data_path=f'pose.bones["{bone_name}"].rotation_quaternion', index=i) for i
-                           in range(4)]
-            batch_load_fcurves(rot_fcurves, rotations)
-
-            scl_fcurves = [action.fcurves.new(data_path=f'pose.bones["{bone_name}"].scale', index=i) for i in range(3)]
-            batch_load_fcurves(scl_fcurves, scales)
+                fcurve.update()
+
+        bones = [(bone_name, track_data, self.get_rest_pose(bone_name))
+                 for bone_name, track_data in track_data_cache.items()]
+        bones = [bone for bone in bones if bone[2] is not None]
+
+        # --- 1. Decompose rest_inv @ (T @ R) for every key of every bone before touching bpy ---
+        # Its translation only depends on T and its rotation only on R, so each is computed over
+        # the track's own keys (num_frames of them, or a single one for a constant track).
+        all_rotations = []
+        if bones:
+            # One pass over all bones' rotation keys, each paired with its bone's rest rotation
+            key_counts = [len(track_data['R']) for _, track_data, _ in bones]
+            rest_rots = np.stack([rest_rot for _, _, (rest_rot, _) in bones])
+            rest_index = np.repeat(np.arange(len(bones)), key_counts)
+            all_quats = np.concatenate([track_data['R'] for _, track_data, _ in bones])
+            if _HAVE_NUMBA:
+                rotations = _pose_delta_rotations(rest_rots, rest_index, all_quats)
+            else:
+                rotations = _mat3_to_quats(rest_rots[rest_index] @ _quats_to_mat3(all_quats))
+            all_rotations = np.split(rotations, np.cumsum(key_counts)[:-1])
+
+        # --- 2. Batch-load keyframes from the prepared NumPy arrays ---
+        for (bone_name, track_data, (rest_rot, rest_loc)), rotations in zip(bones, all_rotations):
+            locations = (track_data['T'] * self.global_scale) @ rest_rot.T + rest_loc
+            scales = track_data['S']
+
+            # Group each bone's channels under its name, as keyframe insertion from the UI does
+            bone_path = f'pose.bones["{bone_name}"]'
+            for prop, data_array in (('.location', locations), ('.rotation_quaternion', rotations), ('.scale', scales)):
+                data_path = bone_path + prop
+                fcurves = [action.fcurves.new(data_path=data_path, index=i, action_group=bone_name)
+                           for i in range(data_array.shape[1])]
+                batch_load_fcurves(fcurves, data_array)
 
         bpy.context.scene.frame_end = max(bpy.context.scene.frame_end, num_frames)
         bpy.context.scene.render.fps = anim_data['frame_rate']
-        bpy.ops.object.mode_set(mode='OBJECT')
 
 
 class ImportTLG(bpy.types.Operator, ImportHelper):
@@ -1497,6 +1825,7 @@ def register():
 def unregister():
     bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
     for cls in reversed(classes_to_register): bpy.utils.unregister_class(cls)
+    _PARSED_BOD_CACHE.clear()
 
 
 if __name__ == "__main__":